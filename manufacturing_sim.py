@@ -4,12 +4,25 @@ Competitive Phone Manufacturing Simulation
 A game where up to 4 players compete to be the manufacturing leader of phones.
 """
 
+import contextlib
+import io
 import json
 import os
 import random
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+import sys
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter, getitem, mul
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the standard library json module
+    orjson = None
+
+# orjson 3.9+ can splice pre-encoded JSON into its output
+JSON_FRAGMENTS_SUPPORTED = hasattr(orjson, 'Fragment')
 
 
 # Quality tier enum
@@ -20,9 +33,12 @@ class Quality(Enum):
 
 
 # Game constants
-CORE_PARTS = ['ram', 'soc', 'screen', 'battery', 'camera', 'casing', 'storage']
-OPTIONAL_PARTS = ['fingerprint']
+CORE_PARTS = ('ram', 'soc', 'screen', 'battery', 'camera', 'casing', 'storage')
+OPTIONAL_PARTS = ('fingerprint',)
 ALL_PARTS = CORE_PARTS + OPTIONAL_PARTS
+ALL_PARTS_SET = frozenset(ALL_PARTS)  # For membership tests
+PART_DISPLAY_NAMES = {part: part.capitalize() for part in ALL_PARTS}  # Part names as shown in menus
+PART_INDEX = {part: i for i, part in enumerate(ALL_PARTS)}  # Position of each part in per-part arrays
 MAX_TIER = 10
 MAX_BLUEPRINTS = 10
 STARTING_MONEY = 100000
@@ -39,57 +55,94 @@ SCORING_WEIGHTS = {
     'casing': 1,
     'fingerprint': 0  # Optional part, doesn't contribute to tier scoring
 }
-
-# R&D costs and time (tier: (cost, months))
-RND_CONFIG = {
-    2: (5000, 2),
-    3: (10000, 3),
-    4: (20000, 4),
-    5: (40000, 5),
-    6: (70000, 6),
-    7: (110000, 7),
-    8: (160000, 8),
-    9: (220000, 9),
-    10: (300000, 10),
-}
+SCORING_WEIGHT_VECTOR = tuple(SCORING_WEIGHTS[part] for part in CORE_PARTS)  # In CORE_PARTS order
+
+# R&D costs and time, indexed by tier: (cost, months)
+# Tier 1 is always unlocked, so indices 0 and 1 are unused
+RND_CONFIG = (
+    None,
+    None,
+    (5000, 2),
+    (10000, 3),
+    (20000, 4),
+    (40000, 5),
+    (70000, 6),
+    (110000, 7),
+    (160000, 8),
+    (220000, 9),
+    (300000, 10),
+)
 
 # Part costs per tier (differentiated by component type)
 # Hierarchy: SoC > Screen > RAM > Storage > Battery > Camera > Casing
+# Each tuple is indexed directly by tier; index 0 is unused
 PART_COSTS = {
-    'soc': {
-        1: 15, 2: 40, 3: 80, 4: 160, 5: 320,
-        6: 600, 7: 1000, 8: 1600, 9: 2500, 10: 4000
-    },
-    'screen': {
-        1: 12, 2: 30, 3: 65, 4: 130, 5: 260,
-        6: 480, 7: 800, 8: 1300, 9: 2000, 10: 3200
-    },
-    'ram': {
-        1: 8, 2: 20, 3: 45, 4: 90, 5: 180,
-        6: 350, 7: 600, 8: 1000, 9: 1600, 10: 2600
-    },
-    'storage': {
-        1: 7, 2: 18, 3: 40, 4: 80, 5: 160,
-        6: 300, 7: 520, 8: 900, 9: 1450, 10: 2400
-    },
-    'battery': {
-        1: 5, 2: 15, 3: 35, 4: 70, 5: 140,
-        6: 260, 7: 450, 8: 780, 9: 1250, 10: 2100
-    },
-    'camera': {
-        1: 4, 2: 12, 3: 28, 4: 60, 5: 120,
-        6: 230, 7: 400, 8: 700, 9: 1100, 10: 1900
-    },
-    'casing': {
-        1: 3, 2: 8, 3: 20, 4: 45, 5: 90,
-        6: 180, 7: 320, 8: 560, 9: 900, 10: 1500
-    },
-    'fingerprint': {
-        1: 3, 2: 8, 3: 18, 4: 40, 5: 80,
-        6: 150, 7: 270, 8: 470, 9: 750, 10: 1250
-    },
+    'soc': (
+        0,
+        15, 40, 80, 160, 320,
+        600, 1000, 1600, 2500, 4000,
+    ),
+    'screen': (
+        0,
+        12, 30, 65, 130, 260,
+        480, 800, 1300, 2000, 3200,
+    ),
+    'ram': (
+        0,
+        8, 20, 45, 90, 180,
+        350, 600, 1000, 1600, 2600,
+    ),
+    'storage': (
+        0,
+        7, 18, 40, 80, 160,
+        300, 520, 900, 1450, 2400,
+    ),
+    'battery': (
+        0,
+        5, 15, 35, 70, 140,
+        260, 450, 780, 1250, 2100,
+    ),
+    'camera': (
+        0,
+        4, 12, 28, 60, 120,
+        230, 400, 700, 1100, 1900,
+    ),
+    'casing': (
+        0,
+        3, 8, 20, 45, 90,
+        180, 320, 560, 900, 1500,
+    ),
+    'fingerprint': (
+        0,
+        3, 8, 18, 40, 80,
+        150, 270, 470, 750, 1250,
+    ),
 }
 
+# Cost multiplier applied to a part's base cost for each quality level
+QUALITY_COST_MULTIPLIERS = {"Low": 0.5, "Normal": 1, "High": 1.5}
+
+
+class QualityCostTable(dict):
+    """A part's tier costs by quality; an unrecognised quality costs the same as Normal"""
+
+    def __missing__(self, quality):
+        return self["Normal"]
+
+
+# Quality-adjusted cost tables in ALL_PARTS order: [part][quality][tier] -> unit cost,
+# for walking a blueprint's tiers and qualities in one pass
+PART_COST_TABLES = tuple(
+    QualityCostTable(
+        (quality, tuple(cost * multiplier for cost in PART_COSTS[part]))
+        for quality, multiplier in QUALITY_COST_MULTIPLIERS.items()
+    )
+    for part in ALL_PARTS
+)
+
+# Quality prompt answers (blank keeps the Normal default)
+QUALITY_CHOICES = {'': "Normal", 'N': "Normal", 'L': "Low", 'H': "High"}
+
 # Customer tier distribution (fixed percentages)
 CUSTOMER_TIER_DISTRIBUTION = {
     'Entry Level': 0.15,  # 15%
@@ -99,6 +152,10 @@ CUSTOMER_TIER_DISTRIBUTION = {
     'Flagship': 0.05,     # 5%
 }
 
+# Market tiers from lowest to highest score
+TIER_NAMES = ('Entry Level', 'Budget', 'Midrange', 'High End', 'Flagship')
+TIER_SCORE_STEP = 20  # Score width of each tier (and threshold shift per global tech level)
+
 # Market size - fixed at 20,000 people
 MARKET_SIZE = 20000
 
@@ -203,8 +260,66 @@ CUSTOMER_TYPES = {
     },
 }
 
+CUSTOMER_TYPE_NAMES = tuple(CUSTOMER_TYPES)  # In declaration order
 
-@dataclass
+# Customer preference weights in CORE_PARTS order (matches the first 7 blueprint part tiers)
+CUSTOMER_TYPE_WEIGHTS = {
+    customer_type: tuple(preferences[part] for part in CORE_PARTS)
+    for customer_type, preferences in CUSTOMER_TYPES.items()
+}
+
+
+def write_lines(lines: List[str]):
+    """Write a block of lines to stdout with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def prompt_int(prompt: str, low: int, high: Optional[int], out_of_range: str,
+               invalid: str = "Invalid input") -> int:
+    """Ask for a whole number until one between low and high is entered (high=None: no upper limit)"""
+    while True:
+        try:
+            value = int(input(prompt))
+        except ValueError:
+            print(invalid)
+            continue
+        if low <= value and (high is None or value <= high):
+            return value
+        print(out_of_range)
+
+
+def score_phone_for_type(phone: 'PhoneBlueprint', customer_type: str) -> float:
+    """Score a phone for a customer type (before the brand reputation bonus)"""
+    return phone._type_scores[customer_type]
+
+
+def score_phone_for_all_types(part_tiers: tuple, sell_price: int) -> Dict[str, float]:
+    """Score a set of part tiers for every customer type at once"""
+    scores = {
+        customer_type: sum(map(mul, weights, part_tiers))
+        for customer_type, weights in CUSTOMER_TYPE_WEIGHTS.items()
+    }
+
+    # Value hunters also consider price (lower price = better for them)
+    # Normalize price impact (assuming max reasonable price is 5000)
+    price_penalty = sell_price / 5000 * 20
+    scores['Value Hunter'] -= price_penalty
+
+    return scores
+
+
+def market_tier_for_score(score: int, global_tech_level: int = 1) -> str:
+    """
+    Map a quality score to its market tier. Tiers are TIER_SCORE_STEP points wide
+    (Entry Level up to 20, Budget up to 40, ... Flagship above 80), and every
+    global tech level shifts all thresholds up by another step.
+    """
+    threshold_shift = (global_tech_level - 1) * TIER_SCORE_STEP
+    tier_index = (score - threshold_shift - 1) // TIER_SCORE_STEP
+    return TIER_NAMES[min(len(TIER_NAMES) - 1, max(0, tier_index))]
+
+
+@dataclass(slots=True)
 class CustomerGroup:
     """
     Represents a group of similar customers in the market.
@@ -221,78 +336,38 @@ class CustomerGroup:
     last_camera_check_month: Optional[int] = None  # For camera enthusiasts
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'tier': self.tier,
+            'customer_type': self.customer_type,
+            'count': self.count,
+            'owned_phone_company': self.owned_phone_company,
+            'owned_phone_blueprint': self.owned_phone_blueprint,
+            'purchase_month': self.purchase_month,
+            'last_camera_check_month': self.last_camera_check_month,
+        }
 
     @staticmethod
     def from_dict(data):
         return CustomerGroup(**data)
 
-    def evaluate_phone(self, phone: 'PhoneBlueprint') -> float:
-        """
-        Evaluate a phone based on customer preferences.
-        Returns a satisfaction score.
-        """
-        preferences = CUSTOMER_TYPES[self.customer_type]
-        score = 0
-
-        # Evaluate each component based on preferences
-        score += phone.soc_tier * preferences['soc']
-        score += phone.ram_tier * preferences['ram']
-        score += phone.battery_tier * preferences['battery']
-        score += phone.screen_tier * preferences['screen']
-        score += phone.camera_tier * preferences['camera']
-        score += phone.storage_tier * preferences['storage']
-        score += phone.casing_tier * preferences['casing']
-
-        # Value hunters also consider price (lower price = better for them)
-        if self.customer_type == 'Value Hunter':
-            # Normalize price impact (assuming max reasonable price is 5000)
-            price_penalty = phone.sell_price / 5000 * 20
-            score -= price_penalty
-
-        return score
-
-
-@dataclass
-class Customer:
-    """Represents a customer in the market (DEPRECATED - use CustomerGroup instead)"""
-    tier: str  # Entry Level, Budget, Midrange, High End, Flagship
-    customer_type: str  # Gamer, Camera Enthusiast, etc.
-
-    def to_dict(self):
-        return asdict(self)
+    def to_row(self):
+        """Serialize as a list in field order (the compact form used in save files)"""
+        return [self.tier, self.customer_type, self.count, self.owned_phone_company,
+                self.owned_phone_blueprint, self.purchase_month, self.last_camera_check_month]
 
     @staticmethod
-    def from_dict(data):
-        return Customer(**data)
+    def from_row(row):
+        return CustomerGroup(*row)
 
     def evaluate_phone(self, phone: 'PhoneBlueprint') -> float:
         """
         Evaluate a phone based on customer preferences.
         Returns a satisfaction score.
         """
-        preferences = CUSTOMER_TYPES[self.customer_type]
-        score = 0
+        return score_phone_for_type(phone, self.customer_type)
 
-        # Evaluate each component based on preferences
-        score += phone.soc_tier * preferences['soc']
-        score += phone.ram_tier * preferences['ram']
-        score += phone.battery_tier * preferences['battery']
-        score += phone.screen_tier * preferences['screen']
-        score += phone.camera_tier * preferences['camera']
-        score += phone.storage_tier * preferences['storage']
-        score += phone.casing_tier * preferences['casing']
 
-        # Value hunters also consider price (lower price = better for them)
-        if self.customer_type == 'Value Hunter':
-            # Normalize price impact (assuming max reasonable price is 5000)
-            price_penalty = phone.sell_price / 5000 * 20
-            score -= price_penalty
-
-        return score
-
-
-@dataclass
+@dataclass(slots=True)
 class RnDProject:
     """Represents an ongoing R&D project"""
     part_type: str
@@ -301,14 +376,19 @@ class RnDProject:
     cost: int
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'part_type': self.part_type,
+            'target_tier': self.target_tier,
+            'months_remaining': self.months_remaining,
+            'cost': self.cost,
+        }
 
     @staticmethod
     def from_dict(data):
         return RnDProject(**data)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PhoneBlueprint:
     """Represents a phone design/blueprint"""
     name: str
@@ -330,38 +410,84 @@ class PhoneBlueprint:
     casing_quality: str = "Normal"
     storage_quality: str = "Normal"
     fingerprint_quality: str = "Normal"
+    # Blueprints are frozen, so derived values are cached (set with object.__setattr__)
+    _part_tiers: tuple = field(init=False, repr=False, compare=False)  # Installed parts, in ALL_PARTS order
+    _part_qualities: tuple = field(init=False, repr=False, compare=False)
+    _production_cost: int = field(init=False, repr=False, compare=False)
+    _repair_return_rate: float = field(init=False, repr=False, compare=False)
+    _score: int = field(init=False, repr=False, compare=False)
+    _type_scores: dict = field(init=False, repr=False, compare=False)  # customer type -> score
+    _tier_names: dict = field(init=False, default_factory=dict, repr=False, compare=False)  # global tech level -> tier name
+    _dict_cache: Optional[dict] = field(init=False, default=None, repr=False, compare=False)
+    _json_cache: Optional[bytes] = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        tiers = (self.ram_tier, self.soc_tier, self.screen_tier, self.battery_tier,
+                 self.camera_tier, self.casing_tier, self.storage_tier)
+        qualities = (self.ram_quality, self.soc_quality, self.screen_quality, self.battery_quality,
+                     self.camera_quality, self.casing_quality, self.storage_quality)
+        if self.fingerprint_tier > 0:
+            tiers += (self.fingerprint_tier,)
+            qualities += (self.fingerprint_quality,)
+        set_cached = object.__setattr__
+        set_cached(self, '_part_tiers', tiers)
+        set_cached(self, '_part_qualities', qualities)
+        set_cached(self, '_production_cost', self._calculate_production_cost())
+        set_cached(self, '_repair_return_rate', self._calculate_repair_return_rate())
+        set_cached(self, '_score', self._calculate_score())
+        set_cached(self, '_type_scores', score_phone_for_all_types(tiers, self.sell_price))
 
     def to_dict(self):
-        return asdict(self)
+        """Serialize the blueprint (a fresh copy of a dict built once - all values are immutable)"""
+        if self._dict_cache is None:
+            object.__setattr__(self, '_dict_cache', {
+                'name': self.name,
+                'ram_tier': self.ram_tier,
+                'soc_tier': self.soc_tier,
+                'screen_tier': self.screen_tier,
+                'battery_tier': self.battery_tier,
+                'camera_tier': self.camera_tier,
+                'casing_tier': self.casing_tier,
+                'storage_tier': self.storage_tier,
+                'fingerprint_tier': self.fingerprint_tier,
+                'sell_price': self.sell_price,
+                'ram_quality': self.ram_quality,
+                'soc_quality': self.soc_quality,
+                'screen_quality': self.screen_quality,
+                'battery_quality': self.battery_quality,
+                'camera_quality': self.camera_quality,
+                'casing_quality': self.casing_quality,
+                'storage_quality': self.storage_quality,
+                'fingerprint_quality': self.fingerprint_quality,
+            })
+        return dict(self._dict_cache)
+
+    def to_json_fragment(self):
+        """Serialize the blueprint as an orjson Fragment (encoded once, then reused)"""
+        if self._json_cache is None:
+            object.__setattr__(self, '_json_cache', orjson.dumps(self.to_dict()))
+        return orjson.Fragment(self._json_cache)
 
     @staticmethod
     def from_dict(data):
         return PhoneBlueprint(**data)
 
     def get_production_cost(self):
+        """Get the cost to manufacture one unit (cached at construction)"""
+        return self._production_cost
+
+    def _calculate_production_cost(self):
         """Calculate the cost to manufacture one unit with quality multipliers"""
-        def apply_quality_multiplier(base_cost, quality):
-            """Apply quality multiplier: Low=0.5x, Normal=1.0x, High=1.5x"""
-            if quality == "Low":
-                return base_cost * 0.5
-            elif quality == "High":
-                return base_cost * 1.5
-            else:  # Normal
-                return base_cost
-
-        cost = 0
-        cost += apply_quality_multiplier(PART_COSTS['ram'][self.ram_tier], self.ram_quality)
-        cost += apply_quality_multiplier(PART_COSTS['soc'][self.soc_tier], self.soc_quality)
-        cost += apply_quality_multiplier(PART_COSTS['screen'][self.screen_tier], self.screen_quality)
-        cost += apply_quality_multiplier(PART_COSTS['battery'][self.battery_tier], self.battery_quality)
-        cost += apply_quality_multiplier(PART_COSTS['camera'][self.camera_tier], self.camera_quality)
-        cost += apply_quality_multiplier(PART_COSTS['casing'][self.casing_tier], self.casing_quality)
-        cost += apply_quality_multiplier(PART_COSTS['storage'][self.storage_tier], self.storage_quality)
-        if self.fingerprint_tier > 0:
-            cost += apply_quality_multiplier(PART_COSTS['fingerprint'][self.fingerprint_tier], self.fingerprint_quality)
+        # Low=0.5x, Normal=1.0x, High=1.5x
+        cost_tables = map(getitem, PART_COST_TABLES, self._part_qualities)
+        cost = sum(map(getitem, cost_tables, self._part_tiers))
         return int(cost)
 
     def get_repair_return_rate(self):
+        """Get the percentage of sold devices returned for repair each month (cached at construction)"""
+        return self._repair_return_rate
+
+    def _calculate_repair_return_rate(self):
         """
         Calculate the probability that a device will be returned for repairs.
         Based on screen and casing quality:
@@ -386,49 +512,30 @@ class PhoneBlueprint:
 
     def get_repair_cost(self):
         """Calculate the cost to repair one unit (25% of production cost)"""
-        return int(self.get_production_cost() * 0.25)
+        return self._production_cost // 4
 
     def calculate_score(self):
+        """Get the phone's quality score (cached at construction)"""
+        return self._score
+
+    def _calculate_score(self):
         """Calculate the phone's quality score based on component tiers and weights"""
-        score = 0
-        score += self.soc_tier * SCORING_WEIGHTS['soc']
-        score += self.battery_tier * SCORING_WEIGHTS['battery']
-        score += self.screen_tier * SCORING_WEIGHTS['screen']
-        score += self.ram_tier * SCORING_WEIGHTS['ram']
-        score += self.camera_tier * SCORING_WEIGHTS['camera']
-        score += self.storage_tier * SCORING_WEIGHTS['storage']
-        score += self.casing_tier * SCORING_WEIGHTS['casing']
-        # Fingerprint doesn't contribute to tier scoring
-        return score
+        # Pairs with the core part tiers only - fingerprint doesn't contribute to tier scoring
+        return sum(map(mul, SCORING_WEIGHT_VECTOR, self._part_tiers))
 
     def get_tier_name(self, global_tech_level: int = 1):
         """Determine the phone's market tier based on score and global tech level"""
-        score = self.calculate_score()
-
-        # Calculate threshold shift based on tech advancement
-        # Each tech level increase shifts thresholds by 20 points
-        threshold_shift = (global_tech_level - 1) * 20
-
-        # Define tier thresholds (base values + shift)
-        entry_level_max = 20 + threshold_shift
-        budget_max = 40 + threshold_shift
-        midrange_max = 60 + threshold_shift
-        high_end_max = 80 + threshold_shift
-        flagship_max = 100 + threshold_shift
-
-        if score <= entry_level_max:
-            return "Entry Level"
-        elif score <= budget_max:
-            return "Budget"
-        elif score <= midrange_max:
-            return "Midrange"
-        elif score <= high_end_max:
-            return "High End"
-        else:
-            return "Flagship"
+        tier_name = self._tier_names.get(global_tech_level)
+        if tier_name is None:
+            tier_name = self._tier_names[global_tech_level] = market_tier_for_score(self._score, global_tech_level)
+        return tier_name
 
     def display(self, global_tech_level: int = 1):
         """Display blueprint details"""
+        write_lines(self.get_display_lines(global_tech_level))
+
+    def get_display_lines(self, global_tech_level: int = 1) -> List[str]:
+        """Build the lines shown by display()"""
         def quality_symbol(quality):
             """Return a short symbol for quality"""
             if quality == "Low":
@@ -441,53 +548,142 @@ class PhoneBlueprint:
         score = self.calculate_score()
         tier_name = self.get_tier_name(global_tech_level)
 
-        print(f"\n  Blueprint: {self.name}")
-        print(f"  Market Tier: {tier_name} (Score: {score})")
-        print(f"  RAM: T{self.ram_tier}({quality_symbol(self.ram_quality)}) | SoC: T{self.soc_tier}({quality_symbol(self.soc_quality)}) | Screen: T{self.screen_tier}({quality_symbol(self.screen_quality)}) | Storage: T{self.storage_tier}({quality_symbol(self.storage_quality)})")
-        print(f"  Battery: T{self.battery_tier}({quality_symbol(self.battery_quality)}) | Camera: T{self.camera_tier}({quality_symbol(self.camera_quality)}) | Casing: T{self.casing_tier}({quality_symbol(self.casing_quality)})")
+        lines = [
+            f"\n  Blueprint: {self.name}",
+            f"  Market Tier: {tier_name} (Score: {score})",
+            f"  RAM: T{self.ram_tier}({quality_symbol(self.ram_quality)}) | SoC: T{self.soc_tier}({quality_symbol(self.soc_quality)}) | Screen: T{self.screen_tier}({quality_symbol(self.screen_quality)}) | Storage: T{self.storage_tier}({quality_symbol(self.storage_quality)})",
+            f"  Battery: T{self.battery_tier}({quality_symbol(self.battery_quality)}) | Camera: T{self.camera_tier}({quality_symbol(self.camera_quality)}) | Casing: T{self.casing_tier}({quality_symbol(self.casing_quality)})",
+        ]
         if self.fingerprint_tier > 0:
-            print(f"  Fingerprint: T{self.fingerprint_tier}({quality_symbol(self.fingerprint_quality)})")
+            lines.append(f"  Fingerprint: T{self.fingerprint_tier}({quality_symbol(self.fingerprint_quality)})")
         else:
-            print(f"  Fingerprint: None")
-        print(f"  Quality: L=Low (0.5x cost), N=Normal (1x cost), H=High (1.5x cost)")
-        print(f"  Production Cost: ${self.get_production_cost()} | Sell Price: ${self.sell_price}")
-        print(f"  Profit per unit: ${self.sell_price - self.get_production_cost()}")
-        print(f"  Repair Return Rate: {self.get_repair_return_rate():.2f}%")
+            lines.append(f"  Fingerprint: None")
+        lines.append(f"  Quality: L=Low (0.5x cost), N=Normal (1x cost), H=High (1.5x cost)")
+        cost = self._production_cost
+        lines.append(f"  Production Cost: ${cost} | Sell Price: ${self.sell_price}")
+        lines.append(f"  Profit per unit: ${self.sell_price - cost}")
+        lines.append(f"  Repair Return Rate: {self.get_repair_return_rate():.2f}%")
+        return lines
+
+
+class BlueprintList(list):
+    """
+    A player's blueprint list that keeps a name -> blueprint index (by_name) in
+    step with every edit, including edits made to the list directly. Like a scan
+    of the list, the index finds the first blueprint with a given name.
+    """
+
+    __slots__ = ('by_name',)
+
+    def __init__(self, blueprints=()):
+        super().__init__(blueprints)
+        self.by_name: Dict[str, PhoneBlueprint] = {}
+        self._reindex()
+
+    def __reduce__(self):
+        return BlueprintList, (list(self),)
+
+    def _reindex(self):
+        """Rebuild the index in place (at most MAX_BLUEPRINTS entries)"""
+        by_name = self.by_name
+        by_name.clear()
+        for blueprint in reversed(self):
+            by_name[blueprint.name] = blueprint
+
+    def append(self, blueprint):
+        super().append(blueprint)
+        self.by_name.setdefault(blueprint.name, blueprint)
+
+    def extend(self, blueprints):
+        super().extend(blueprints)
+        self._reindex()
+
+    def __iadd__(self, blueprints):
+        self.extend(blueprints)
+        return self
+
+    # Any other edit can remove or reorder entries, so the index is rebuilt
+
+    def insert(self, index, blueprint):
+        super().insert(index, blueprint)
+        self._reindex()
+
+    def remove(self, blueprint):
+        super().remove(blueprint)
+        self._reindex()
+
+    def pop(self, index=-1):
+        blueprint = super().pop(index)
+        self._reindex()
+        return blueprint
+
+    def clear(self):
+        super().clear()
+        self.by_name.clear()
+
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._reindex()
+
+    def reverse(self):
+        super().reverse()
+        self._reindex()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._reindex()
+        return self
 
 
 class Player:
     """Represents a player in the game"""
 
+    __slots__ = (
+        'name', 'money', 'current_month', 'unlocked_tiers', 'ongoing_rnd',
+        '_blueprints', '_blueprints_by_name', 'manufactured_phones',
+        'mq_names', 'mq_quantities', 'mq_months_remaining',
+        'manufacturing_used_this_month', 'sold_devices', 'pending_repairs',
+        'brand_reputation', 'price_history', 'rejected_repairs_this_month',
+        'verbose',
+    )
+
     def __init__(self, name: str):
         self.name = name
         self.money = STARTING_MONEY
         self.current_month = 1
 
         # Start with T1-T5 unlocked for core parts, T1-T5 for optional parts
-        self.unlocked_tiers: Dict[str, int] = {}
-        for part in CORE_PARTS:
-            self.unlocked_tiers[part] = 5
-        for part in OPTIONAL_PARTS:
-            self.unlocked_tiers[part] = 5
+        # (one entry per part, in ALL_PARTS order - see PART_INDEX)
+        self.unlocked_tiers: List[int] = [5] * len(ALL_PARTS)
 
         # Ongoing R&D projects
         self.ongoing_rnd: List[RnDProject] = []
 
-        # Phone blueprints
-        self.blueprints: List[PhoneBlueprint] = []
+        # Phone blueprints (the list keeps a name index for O(1) lookups)
+        self.blueprints = BlueprintList()
 
         # Manufactured phones ready to sell (blueprint_name -> quantity)
-        self.manufactured_phones: Dict[str, int] = {}
+        self.manufactured_phones: Dict[str, int] = defaultdict(int)
 
-        # Manufacturing queue (blueprint_name, quantity, months_remaining)
-        self.manufacturing_queue: List[tuple] = []
+        # Manufacturing queue, stored as parallel lists (one entry per order)
+        self.mq_names: List[str] = []
+        self.mq_quantities: List[int] = []
+        self.mq_months_remaining: List[int] = []
 
         # Track manufacturing units used this month
         self.manufacturing_used_this_month: int = 0
 
         # Track sold devices and repairs (blueprint_name -> quantity)
-        self.sold_devices: Dict[str, int] = {}  # Total devices sold (for calculating repair returns)
-        self.pending_repairs: Dict[str, int] = {}  # Devices awaiting repair decision
+        self.sold_devices: Dict[str, int] = defaultdict(int)  # Total devices sold (for calculating repair returns)
+        self.pending_repairs: Dict[str, int] = defaultdict(int)  # Devices awaiting repair decision
 
         # Brand reputation system (0-100, starts at 50)
         self.brand_reputation: float = 50.0
@@ -498,20 +694,28 @@ class Player:
         # Track rejected repairs this month (for brand penalty calculation)
         self.rejected_repairs_this_month: int = 0
 
+        # Print progress messages from game actions (off for headless runs)
+        self.verbose: bool = True
+
+    def _print(self, *args, **kwargs):
+        """print() for game action messages, silenced when verbose is off"""
+        if self.verbose:
+            print(*args, **kwargs)
+
     def to_dict(self):
         """Convert player to dictionary for JSON serialization"""
         return {
             'name': self.name,
             'money': self.money,
             'current_month': self.current_month,
-            'unlocked_tiers': self.unlocked_tiers,
+            'unlocked_tiers': dict(zip(ALL_PARTS, self.unlocked_tiers)),
             'ongoing_rnd': [proj.to_dict() for proj in self.ongoing_rnd],
             'blueprints': [bp.to_dict() for bp in self.blueprints],
-            'manufactured_phones': self.manufactured_phones,
-            'manufacturing_queue': self.manufacturing_queue,
+            'manufactured_phones': dict(self.manufactured_phones),
+            'manufacturing_queue': list(zip(self.mq_names, self.mq_quantities, self.mq_months_remaining)),
             'manufacturing_used_this_month': self.manufacturing_used_this_month,
-            'sold_devices': self.sold_devices,
-            'pending_repairs': self.pending_repairs,
+            'sold_devices': dict(self.sold_devices),
+            'pending_repairs': dict(self.pending_repairs),
             'brand_reputation': self.brand_reputation,
             'price_history': self.price_history,
             'rejected_repairs_this_month': self.rejected_repairs_this_month,
@@ -523,131 +727,197 @@ class Player:
         player = Player(data['name'])
         player.money = data['money']
         player.current_month = data['current_month']
-        player.unlocked_tiers = data['unlocked_tiers']
+        unlocked_tiers = data['unlocked_tiers']
+        player.unlocked_tiers = [unlocked_tiers[part] for part in ALL_PARTS]
         player.ongoing_rnd = [RnDProject.from_dict(proj) for proj in data['ongoing_rnd']]
         player.blueprints = [PhoneBlueprint.from_dict(bp) for bp in data['blueprints']]
-        player.manufactured_phones = data['manufactured_phones']
-        player.manufacturing_queue = data.get('manufacturing_queue', [])
+        player.manufactured_phones = defaultdict(int, data['manufactured_phones'])
+        manufacturing_queue = data.get('manufacturing_queue', [])
+        player.mq_names = [entry[0] for entry in manufacturing_queue]
+        player.mq_quantities = [entry[1] for entry in manufacturing_queue]
+        player.mq_months_remaining = [entry[2] for entry in manufacturing_queue]
         player.manufacturing_used_this_month = data.get('manufacturing_used_this_month', 0)
-        player.sold_devices = data.get('sold_devices', {})
-        player.pending_repairs = data.get('pending_repairs', {})
+        player.sold_devices = defaultdict(int, data.get('sold_devices', {}))
+        player.pending_repairs = defaultdict(int, data.get('pending_repairs', {}))
         player.brand_reputation = data.get('brand_reputation', 50.0)
         player.price_history = data.get('price_history', {})
         player.rejected_repairs_this_month = data.get('rejected_repairs_this_month', 0)
         return player
 
+    @property
+    def blueprints(self) -> BlueprintList:
+        """The player's phone blueprints"""
+        return self._blueprints
+
+    @blueprints.setter
+    def blueprints(self, blueprints):
+        # Wrap assigned lists so the name index always covers them
+        self._blueprints = BlueprintList(blueprints)
+        self._blueprints_by_name = self._blueprints.by_name
+
+    def get_blueprint(self, blueprint_name: str) -> Optional[PhoneBlueprint]:
+        """Find a blueprint by name (None if not found)"""
+        return self._blueprints_by_name.get(blueprint_name)
+
+    def tier_of(self, part: str) -> int:
+        """Get the highest unlocked tier for a part"""
+        return self.unlocked_tiers[PART_INDEX[part]]
+
+    def get_status_lines(self) -> List[str]:
+        """Build the lines of the player's status header"""
+        return [
+            f"\n{'='*60}",
+            f"Player: {self.name}",
+            f"Month: {self.current_month} | Money: ${self.money:,}",
+            f"Brand Reputation: {self.brand_reputation:.1f}/100",
+            f"{'='*60}",
+        ]
+
     def display_status(self):
         """Display player's current status"""
-        print(f"\n{'='*60}")
-        print(f"Player: {self.name}")
-        print(f"Month: {self.current_month} | Money: ${self.money:,}")
-        print(f"Brand Reputation: {self.brand_reputation:.1f}/100")
-        print(f"{'='*60}")
+        write_lines(self.get_status_lines())
+
+    def get_unlocked_tiers_lines(self) -> List[str]:
+        """Build the lines listing unlocked tiers for all parts"""
+        lines = ["\n--- Unlocked Tiers ---", "Core parts:"]
+        for part, tier in zip(CORE_PARTS, self.unlocked_tiers):
+            lines.append(f"  {PART_DISPLAY_NAMES[part]}: T{tier}")
+        lines.append("Optional parts:")
+        for part, tier in zip(OPTIONAL_PARTS, self.unlocked_tiers[len(CORE_PARTS):]):
+            if tier == 0:
+                lines.append(f"  {PART_DISPLAY_NAMES[part]}: Not unlocked (need R&D)")
+            else:
+                lines.append(f"  {PART_DISPLAY_NAMES[part]}: T{tier}")
+        return lines
 
     def display_unlocked_tiers(self):
         """Display unlocked tiers for all parts"""
-        print("\n--- Unlocked Tiers ---")
-        print("Core parts:")
-        for part in CORE_PARTS:
-            print(f"  {part.capitalize()}: T{self.unlocked_tiers[part]}")
-        print("Optional parts:")
-        for part in OPTIONAL_PARTS:
-            tier = self.unlocked_tiers[part]
-            if tier == 0:
-                print(f"  {part.capitalize()}: Not unlocked (need R&D)")
-            else:
-                print(f"  {part.capitalize()}: T{tier}")
+        write_lines(self.get_unlocked_tiers_lines())
 
-    def display_ongoing_rnd(self):
-        """Display ongoing R&D projects"""
+    def get_ongoing_rnd_lines(self) -> List[str]:
+        """Build the lines listing ongoing R&D projects"""
         if not self.ongoing_rnd:
-            print("\n--- No ongoing R&D projects ---")
-            return
+            return ["\n--- No ongoing R&D projects ---"]
 
-        print("\n--- Ongoing R&D Projects ---")
+        lines = ["\n--- Ongoing R&D Projects ---"]
         for i, proj in enumerate(self.ongoing_rnd, 1):
-            print(f"  {i}. {proj.part_type.capitalize()} T{proj.target_tier} - "
-                  f"{proj.months_remaining} months remaining")
+            lines.append(f"  {i}. {PART_DISPLAY_NAMES[proj.part_type]} T{proj.target_tier} - "
+                         f"{proj.months_remaining} months remaining")
+        return lines
 
-    def display_blueprints(self, global_tech_level: int = 1):
-        """Display all phone blueprints"""
+    def display_ongoing_rnd(self):
+        """Display ongoing R&D projects"""
+        write_lines(self.get_ongoing_rnd_lines())
+
+    def get_blueprints_lines(self, global_tech_level: int = 1) -> List[str]:
+        """Build the lines listing all phone blueprints"""
         if not self.blueprints:
-            print("\n--- No phone blueprints created ---")
-            return
+            return ["\n--- No phone blueprints created ---"]
 
-        print("\n--- Phone Blueprints ---")
+        lines = ["\n--- Phone Blueprints ---"]
         for i, bp in enumerate(self.blueprints, 1):
-            print(f"\n{i}. ", end="")
-            bp.display(global_tech_level)
+            bp_lines = bp.get_display_lines(global_tech_level)
+            bp_lines[0] = f"\n{i}. {bp_lines[0]}"
+            lines.extend(bp_lines)
+        return lines
 
-    def display_manufactured_phones(self):
-        """Display manufactured phones inventory"""
+    def display_blueprints(self, global_tech_level: int = 1):
+        """Display all phone blueprints"""
+        write_lines(self.get_blueprints_lines(global_tech_level))
+
+    def get_manufactured_phones_lines(self) -> List[str]:
+        """Build the lines listing the manufactured phones inventory"""
         if not self.manufactured_phones:
-            print("\n--- No manufactured phones ---")
-            return
+            return ["\n--- No manufactured phones ---"]
 
-        print("\n--- Manufactured Phones ---")
+        lines = ["\n--- Manufactured Phones ---"]
         for name, qty in self.manufactured_phones.items():
-            print(f"  {name}: {qty} units")
+            lines.append(f"  {name}: {qty} units")
+        return lines
 
-    def display_manufacturing_queue(self):
-        """Display manufacturing queue"""
-        if not self.manufacturing_queue:
-            print("\n--- No phones in manufacturing ---")
-            return
+    def display_manufactured_phones(self):
+        """Display manufactured phones inventory"""
+        write_lines(self.get_manufactured_phones_lines())
+
+    def get_manufacturing_queue_lines(self) -> List[str]:
+        """Build the lines listing the manufacturing queue"""
+        if not self.mq_names:
+            return ["\n--- No phones in manufacturing ---"]
 
-        print("\n--- Manufacturing Queue ---")
-        for i, (blueprint_name, quantity, months_remaining) in enumerate(self.manufacturing_queue, 1):
+        lines = ["\n--- Manufacturing Queue ---"]
+        queue = zip(self.mq_names, self.mq_quantities, self.mq_months_remaining)
+        for i, (blueprint_name, quantity, months_remaining) in enumerate(queue, 1):
             if months_remaining == 1:
-                print(f"  {i}. {blueprint_name}: {quantity} units (completes next month)")
+                lines.append(f"  {i}. {blueprint_name}: {quantity} units (completes next month)")
             else:
-                print(f"  {i}. {blueprint_name}: {quantity} units ({months_remaining} months remaining)")
+                lines.append(f"  {i}. {blueprint_name}: {quantity} units ({months_remaining} months remaining)")
 
         remaining_capacity = MANUFACTURING_LIMIT_PER_MONTH - self.manufacturing_used_this_month
-        print(f"\nManufacturing capacity remaining this month: {remaining_capacity}/{MANUFACTURING_LIMIT_PER_MONTH}")
+        lines.append(f"\nManufacturing capacity remaining this month: {remaining_capacity}/{MANUFACTURING_LIMIT_PER_MONTH}")
+        return lines
 
-    def display_pending_repairs(self):
-        """Display devices pending repair"""
+    def display_manufacturing_queue(self):
+        """Display manufacturing queue"""
+        write_lines(self.get_manufacturing_queue_lines())
+
+    def get_pending_repairs_lines(self) -> List[str]:
+        """Build the lines listing devices pending repair"""
         if not self.pending_repairs:
-            print("\n--- No Pending Repairs ---")
-            return
+            return ["\n--- No Pending Repairs ---"]
 
-        print("\n--- Pending Repairs ---")
+        lines = ["\n--- Pending Repairs ---"]
         total_repair_cost = 0
         for blueprint_name, quantity in self.pending_repairs.items():
             # Find the blueprint to show repair cost
-            blueprint = None
-            for bp in self.blueprints:
-                if bp.name == blueprint_name:
-                    blueprint = bp
-                    break
+            blueprint = self.get_blueprint(blueprint_name)
             if blueprint:
                 repair_cost_per_unit = blueprint.get_repair_cost()
                 total_cost = repair_cost_per_unit * quantity
                 total_repair_cost += total_cost
                 return_rate = blueprint.get_repair_return_rate()
-                print(f"  {blueprint_name}: {quantity} units @ ${repair_cost_per_unit}/unit = ${total_cost:,} total (Return rate: {return_rate:.2f}%)")
+                lines.append(f"  {blueprint_name}: {quantity} units @ ${repair_cost_per_unit}/unit = ${total_cost:,} total (Return rate: {return_rate:.2f}%)")
 
         if total_repair_cost > 0:
-            print(f"\n  Total repair cost if fixing all: ${total_repair_cost:,}")
+            lines.append(f"\n  Total repair cost if fixing all: ${total_repair_cost:,}")
+        return lines
+
+    def display_pending_repairs(self):
+        """Display devices pending repair"""
+        write_lines(self.get_pending_repairs_lines())
+
+    def display_full_status(self, global_tech_level: int = 1):
+        """Display every status section in a single write"""
+        write_lines(
+            self.get_status_lines()
+            + self.get_unlocked_tiers_lines()
+            + self.get_ongoing_rnd_lines()
+            + self.get_blueprints_lines(global_tech_level)
+            + self.get_manufacturing_queue_lines()
+            + self.get_manufactured_phones_lines()
+            + self.get_pending_repairs_lines()
+        )
 
     def complete_manufacturing(self):
         """Complete manufacturing items that are ready (separate from advancing month)"""
         completed_manufacturing = []
-        new_queue = []
-
-        for blueprint_name, quantity, months_remaining in self.manufacturing_queue:
-            if months_remaining <= 0:
-                # Manufacturing is complete
-                completed_manufacturing.append((blueprint_name, quantity))
-                if blueprint_name not in self.manufactured_phones:
-                    self.manufactured_phones[blueprint_name] = 0
-                self.manufactured_phones[blueprint_name] += quantity
+        names, quantities, months_left = self.mq_names, self.mq_quantities, self.mq_months_remaining
+
+        # Compact the queue columns in place: orders still in progress are moved
+        # down over the completed ones, then the leftover tail is cut off
+        kept = 0
+        for i, months_remaining in enumerate(months_left):
+            if months_remaining > 0:
+                if kept != i:
+                    names[kept] = names[i]
+                    quantities[kept] = quantities[i]
+                    months_left[kept] = months_remaining
+                kept += 1
             else:
-                # Still in progress
-                new_queue.append((blueprint_name, quantity, months_remaining))
+                # Manufacturing is complete
+                completed_manufacturing.append((names[i], quantities[i]))
+                self.manufactured_phones[names[i]] += quantities[i]
 
-        self.manufacturing_queue = new_queue
+        del names[kept:], quantities[kept:], months_left[kept:]
         return completed_manufacturing
 
     def advance_month(self):
@@ -657,65 +927,90 @@ class Player:
         # Reset manufacturing limit for new month
         self.manufacturing_used_this_month = 0
 
-        # Update R&D projects
+        # Update R&D projects, splitting them into completed and ongoing in one pass
         completed_projects = []
+        still_ongoing = []
         for proj in self.ongoing_rnd:
             proj.months_remaining -= 1
-            if proj.months_remaining <= 0:
-                completed_projects.append(proj)
-                self.unlocked_tiers[proj.part_type] = proj.target_tier
+            (completed_projects if proj.months_remaining <= 0 else still_ongoing).append(proj)
+        self.ongoing_rnd = still_ongoing
 
-        # Remove completed projects
         for proj in completed_projects:
-            self.ongoing_rnd.remove(proj)
+            self.unlocked_tiers[PART_INDEX[proj.part_type]] = proj.target_tier
 
         if completed_projects:
-            print(f"\n🎉 R&D Projects Completed:")
+            self._print(f"\n🎉 R&D Projects Completed:")
             for proj in completed_projects:
-                print(f"  - {proj.part_type.capitalize()} T{proj.target_tier} unlocked!")
+                self._print(f"  - {PART_DISPLAY_NAMES[proj.part_type]} T{proj.target_tier} unlocked!")
 
         # Decrement manufacturing queue timers (actual completion happens in complete_manufacturing)
-        new_queue = []
-        for blueprint_name, quantity, months_remaining in self.manufacturing_queue:
-            new_queue.append((blueprint_name, quantity, months_remaining - 1))
-        self.manufacturing_queue = new_queue
+        self.mq_months_remaining = [months - 1 for months in self.mq_months_remaining]
+
+    def advance_months(self, months: int):
+        """
+        Advance several months in one step, with the same end state as calling
+        advance_month() that many times. Used for headless fast-forwarding.
+        """
+        if months <= 0:
+            return
+        self.current_month += months
+        self.manufacturing_used_this_month = 0
+
+        completed_projects = []
+        still_ongoing = []
+        for proj in self.ongoing_rnd:
+            proj.months_remaining -= months
+            (completed_projects if proj.months_remaining <= 0 else still_ongoing).append(proj)
+        self.ongoing_rnd = still_ongoing
+
+        # Apply unlocks in the order the projects would have finished
+        completed_projects.sort(key=attrgetter('months_remaining'))
+        for proj in completed_projects:
+            self.unlocked_tiers[PART_INDEX[proj.part_type]] = proj.target_tier
+
+        if completed_projects:
+            self._print(f"\n🎉 R&D Projects Completed:")
+            for proj in completed_projects:
+                self._print(f"  - {PART_DISPLAY_NAMES[proj.part_type]} T{proj.target_tier} unlocked!")
+
+        self.mq_months_remaining = [remaining - months for remaining in self.mq_months_remaining]
 
     def start_rnd(self, part_type: str, target_tier: int, min_tier: int = 1, max_tier: int = MAX_TIER) -> bool:
         """Start a new R&D project"""
         # Validate
-        if part_type not in ALL_PARTS:
-            print(f"❌ Invalid part type: {part_type}")
+        if part_type not in ALL_PARTS_SET:
+            self._print(f"❌ Invalid part type: {part_type}")
             return False
 
-        current_tier = self.unlocked_tiers[part_type]
+        current_tier = self.tier_of(part_type)
 
         # Check if target tier is within available range
         if target_tier < min_tier or target_tier > max_tier:
-            print(f"❌ Tier {target_tier} is not available. Available range: T{min_tier}-T{max_tier}")
+            self._print(f"❌ Tier {target_tier} is not available. Available range: T{min_tier}-T{max_tier}")
             return False
 
         if target_tier < 2 or target_tier > MAX_TIER:
-            print(f"❌ Invalid tier: {target_tier}")
+            self._print(f"❌ Invalid tier: {target_tier}")
             return False
 
         if target_tier <= current_tier:
-            print(f"❌ {part_type.capitalize()} T{target_tier} is already unlocked!")
+            self._print(f"❌ {PART_DISPLAY_NAMES[part_type]} T{target_tier} is already unlocked!")
             return False
 
         if target_tier > current_tier + 1:
-            print(f"❌ Must unlock tiers sequentially. Current: T{current_tier}")
+            self._print(f"❌ Must unlock tiers sequentially. Current: T{current_tier}")
             return False
 
         # Check if already researching this
         for proj in self.ongoing_rnd:
             if proj.part_type == part_type and proj.target_tier == target_tier:
-                print(f"❌ Already researching {part_type.capitalize()} T{target_tier}!")
+                self._print(f"❌ Already researching {PART_DISPLAY_NAMES[part_type]} T{target_tier}!")
                 return False
 
         cost, months = RND_CONFIG[target_tier]
 
         if self.money < cost:
-            print(f"❌ Insufficient funds. Need ${cost:,}, have ${self.money:,}")
+            self._print(f"❌ Insufficient funds. Need ${cost:,}, have ${self.money:,}")
             return False
 
         # Start the project
@@ -723,9 +1018,9 @@ class Player:
         project = RnDProject(part_type, target_tier, months, cost)
         self.ongoing_rnd.append(project)
 
-        print(f"\n✓ Started R&D for {part_type.capitalize()} T{target_tier}")
-        print(f"  Cost: ${cost:,} | Duration: {months} months")
-        print(f"  Remaining balance: ${self.money:,}")
+        self._print(f"\n✓ Started R&D for {PART_DISPLAY_NAMES[part_type]} T{target_tier}")
+        self._print(f"  Cost: ${cost:,} | Duration: {months} months")
+        self._print(f"  Remaining balance: ${self.money:,}")
         return True
 
     def create_blueprint(self, name: str, parts: Dict[str, int], sell_price: int,
@@ -735,30 +1030,31 @@ class Player:
         """Create a new phone blueprint"""
         # Check if max blueprints reached
         if len(self.blueprints) >= MAX_BLUEPRINTS:
-            print(f"❌ Maximum blueprint limit reached ({MAX_BLUEPRINTS})! Delete a blueprint to create a new one.")
+            self._print(f"❌ Maximum blueprint limit reached ({MAX_BLUEPRINTS})! Delete a blueprint to create a new one.")
             return False
 
         # Check if name already exists
-        for bp in self.blueprints:
-            if bp.name == name:
-                print(f"❌ Blueprint '{name}' already exists!")
-                return False
+        if self.get_blueprint(name) is not None:
+            self._print(f"❌ Blueprint '{name}' already exists!")
+            return False
 
         # Validate all mandatory parts are specified
-        for part in CORE_PARTS:
+        # (CORE_PARTS are the leading entries of unlocked_tiers, so zip pairs each part with its tier)
+        unlocked_tiers = self.unlocked_tiers
+        for part, unlocked_tier in zip(CORE_PARTS, unlocked_tiers):
             if part not in parts:
-                print(f"❌ Missing mandatory part: {part}")
+                self._print(f"❌ Missing mandatory part: {part}")
                 return False
 
             tier = parts[part]
 
             # Check if tier is within available range
             if tier < min_tier or tier > max_tier:
-                print(f"❌ {part.capitalize()} T{tier} is not available. Available range: T{min_tier}-T{max_tier}")
+                self._print(f"❌ {PART_DISPLAY_NAMES[part]} T{tier} is not available. Available range: T{min_tier}-T{max_tier}")
                 return False
 
-            if tier > self.unlocked_tiers[part]:
-                print(f"❌ {part.capitalize()} T{tier} not yet unlocked (current: T{self.unlocked_tiers[part]})")
+            if tier > unlocked_tier:
+                self._print(f"❌ {PART_DISPLAY_NAMES[part]} T{tier} not yet unlocked (current: T{unlocked_tier})")
                 return False
 
         # Validate optional parts
@@ -766,17 +1062,18 @@ class Player:
         if fingerprint_tier > 0:
             # Check if tier is within available range
             if fingerprint_tier < min_tier or fingerprint_tier > max_tier:
-                print(f"❌ Fingerprint T{fingerprint_tier} is not available. Available range: T{min_tier}-T{max_tier}")
+                self._print(f"❌ Fingerprint T{fingerprint_tier} is not available. Available range: T{min_tier}-T{max_tier}")
                 return False
 
-            if fingerprint_tier > self.unlocked_tiers['fingerprint']:
-                print(f"❌ Fingerprint T{fingerprint_tier} not yet unlocked (current: T{self.unlocked_tiers['fingerprint']})")
+            unlocked_tier = unlocked_tiers[PART_INDEX['fingerprint']]
+            if fingerprint_tier > unlocked_tier:
+                self._print(f"❌ Fingerprint T{fingerprint_tier} not yet unlocked (current: T{unlocked_tier})")
                 return False
 
         # Set default quality to Normal if not provided
         if quality is None:
             quality = {}
-        for part in CORE_PARTS + OPTIONAL_PARTS:
+        for part in ALL_PARTS:
             if part not in quality:
                 quality[part] = "Normal"
 
@@ -806,78 +1103,65 @@ class Player:
         # Track the initial price for brand reputation monitoring
         self.track_blueprint_price(name, sell_price)
 
-        print(f"\n✓ Created blueprint: {name}")
-        blueprint.display(global_tech_level)
+        self._print(f"\n✓ Created blueprint: {name}")
+        self._print("\n".join(blueprint.get_display_lines(global_tech_level)))
         return True
 
     def delete_blueprint(self, blueprint_name: str) -> bool:
         """Delete a phone blueprint"""
-        # Find blueprint
-        blueprint = None
-        for bp in self.blueprints:
-            if bp.name == blueprint_name:
-                blueprint = bp
-                break
-
+        blueprint = self.get_blueprint(blueprint_name)
         if not blueprint:
-            print(f"❌ Blueprint '{blueprint_name}' not found!")
+            self._print(f"❌ Blueprint '{blueprint_name}' not found!")
             return False
 
         # Check if there are manufactured phones
-        if blueprint_name in self.manufactured_phones and self.manufactured_phones[blueprint_name] > 0:
-            print(f"❌ Cannot delete blueprint '{blueprint_name}': {self.manufactured_phones[blueprint_name]} units in inventory!")
-            print("   Sell all units before deleting the blueprint.")
+        in_stock = self.manufactured_phones.get(blueprint_name, 0)
+        if in_stock > 0:
+            self._print(f"❌ Cannot delete blueprint '{blueprint_name}': {in_stock} units in inventory!")
+            self._print("   Sell all units before deleting the blueprint.")
             return False
 
         # Check if there are pending repairs
-        if blueprint_name in self.pending_repairs and self.pending_repairs[blueprint_name] > 0:
-            print(f"❌ Cannot delete blueprint '{blueprint_name}': {self.pending_repairs[blueprint_name]} units awaiting repair!")
-            print("   Repair or reject all repairs before deleting the blueprint.")
+        awaiting_repair = self.pending_repairs.get(blueprint_name, 0)
+        if awaiting_repair > 0:
+            self._print(f"❌ Cannot delete blueprint '{blueprint_name}': {awaiting_repair} units awaiting repair!")
+            self._print("   Repair or reject all repairs before deleting the blueprint.")
             return False
 
         # Check if there are ongoing manufacturing jobs
-        for name, quantity, months_remaining in self.manufacturing_queue:
+        for name, quantity in zip(self.mq_names, self.mq_quantities):
             if name == blueprint_name:
-                print(f"❌ Cannot delete blueprint '{blueprint_name}': {quantity} units being manufactured!")
-                print("   Wait for manufacturing to complete before deleting the blueprint.")
+                self._print(f"❌ Cannot delete blueprint '{blueprint_name}': {quantity} units being manufactured!")
+                self._print("   Wait for manufacturing to complete before deleting the blueprint.")
                 return False
 
         # Delete the blueprint
         self.blueprints.remove(blueprint)
 
         # Clean up related data
-        if blueprint_name in self.manufactured_phones:
-            del self.manufactured_phones[blueprint_name]
-        if blueprint_name in self.sold_devices:
-            del self.sold_devices[blueprint_name]
-        if blueprint_name in self.price_history:
-            del self.price_history[blueprint_name]
-
-        print(f"\n✓ Deleted blueprint: {blueprint_name}")
+        self.manufactured_phones.pop(blueprint_name, None)
+        self.sold_devices.pop(blueprint_name, None)
+        self.price_history.pop(blueprint_name, None)
+
+        self._print(f"\n✓ Deleted blueprint: {blueprint_name}")
         return True
 
     def manufacture_phone(self, blueprint_name: str, quantity: int) -> bool:
         """Start manufacturing phones based on a blueprint"""
-        # Find blueprint
-        blueprint = None
-        for bp in self.blueprints:
-            if bp.name == blueprint_name:
-                blueprint = bp
-                break
-
+        blueprint = self.get_blueprint(blueprint_name)
         if not blueprint:
-            print(f"❌ Blueprint '{blueprint_name}' not found!")
+            self._print(f"❌ Blueprint '{blueprint_name}' not found!")
             return False
 
         if quantity < 1:
-            print(f"❌ Invalid quantity: {quantity}")
+            self._print(f"❌ Invalid quantity: {quantity}")
             return False
 
         # Check manufacturing capacity
         remaining_capacity = MANUFACTURING_LIMIT_PER_MONTH - self.manufacturing_used_this_month
         if quantity > remaining_capacity:
-            print(f"❌ Insufficient manufacturing capacity. Can only manufacture {remaining_capacity} more units this month.")
-            print(f"   (Monthly limit: {MANUFACTURING_LIMIT_PER_MONTH}, already used: {self.manufacturing_used_this_month})")
+            self._print(f"❌ Insufficient manufacturing capacity. Can only manufacture {remaining_capacity} more units this month.")
+            self._print(f"   (Monthly limit: {MANUFACTURING_LIMIT_PER_MONTH}, already used: {self.manufacturing_used_this_month})")
             return False
 
         # Calculate total cost (parts are bought instantly)
@@ -885,7 +1169,7 @@ class Player:
         total_cost = cost_per_unit * quantity
 
         if self.money < total_cost:
-            print(f"❌ Insufficient funds. Need ${total_cost:,}, have ${self.money:,}")
+            self._print(f"❌ Insufficient funds. Need ${total_cost:,}, have ${self.money:,}")
             return False
 
         # Deduct money and add to manufacturing queue
@@ -895,20 +1179,22 @@ class Player:
         # First month: instant manufacturing (0 months), after that: 1 month
         if self.current_month == 1:
             months_to_complete = 0
-            print(f"\n✓ Started manufacturing {quantity}x {blueprint_name}")
-            print(f"  Parts cost: ${total_cost:,}")
-            print(f"  Will complete instantly (ready to sell this month)")
-            print(f"  Remaining balance: ${self.money:,}")
-            print(f"  Manufacturing capacity used: {self.manufacturing_used_this_month}/{MANUFACTURING_LIMIT_PER_MONTH}")
+            self._print(f"\n✓ Started manufacturing {quantity}x {blueprint_name}")
+            self._print(f"  Parts cost: ${total_cost:,}")
+            self._print(f"  Will complete instantly (ready to sell this month)")
+            self._print(f"  Remaining balance: ${self.money:,}")
+            self._print(f"  Manufacturing capacity used: {self.manufacturing_used_this_month}/{MANUFACTURING_LIMIT_PER_MONTH}")
         else:
             months_to_complete = 1
-            print(f"\n✓ Started manufacturing {quantity}x {blueprint_name}")
-            print(f"  Parts cost: ${total_cost:,}")
-            print(f"  Will complete at end of month (ready to sell next month)")
-            print(f"  Remaining balance: ${self.money:,}")
-            print(f"  Manufacturing capacity used: {self.manufacturing_used_this_month}/{MANUFACTURING_LIMIT_PER_MONTH}")
-
-        self.manufacturing_queue.append((blueprint_name, quantity, months_to_complete))
+            self._print(f"\n✓ Started manufacturing {quantity}x {blueprint_name}")
+            self._print(f"  Parts cost: ${total_cost:,}")
+            self._print(f"  Will complete at end of month (ready to sell next month)")
+            self._print(f"  Remaining balance: ${self.money:,}")
+            self._print(f"  Manufacturing capacity used: {self.manufacturing_used_this_month}/{MANUFACTURING_LIMIT_PER_MONTH}")
+
+        self.mq_names.append(blueprint_name)
+        self.mq_quantities.append(quantity)
+        self.mq_months_remaining.append(months_to_complete)
         return True
 
     def generate_monthly_repairs(self):
@@ -923,11 +1209,7 @@ class Player:
                 continue
 
             # Find the blueprint to get return rate
-            blueprint = None
-            for bp in self.blueprints:
-                if bp.name == blueprint_name:
-                    blueprint = bp
-                    break
+            blueprint = self.get_blueprint(blueprint_name)
 
             if not blueprint:
                 continue
@@ -948,8 +1230,6 @@ class Player:
 
         # Add new repairs to pending repairs
         for blueprint_name, count in new_repairs.items():
-            if blueprint_name not in self.pending_repairs:
-                self.pending_repairs[blueprint_name] = 0
             self.pending_repairs[blueprint_name] += count
 
         return new_repairs
@@ -960,28 +1240,25 @@ class Player:
         Returns True if successful, False otherwise.
         """
         # Check if there are pending repairs for this blueprint
-        if blueprint_name not in self.pending_repairs or self.pending_repairs[blueprint_name] <= 0:
-            print(f"❌ No pending repairs for {blueprint_name}")
+        pending = self.pending_repairs.get(blueprint_name, 0)
+        if pending <= 0:
+            self._print(f"❌ No pending repairs for {blueprint_name}")
             return False
 
         # Check quantity
         if quantity <= 0:
-            print(f"❌ Invalid quantity: {quantity}")
+            self._print(f"❌ Invalid quantity: {quantity}")
             return False
 
-        if quantity > self.pending_repairs[blueprint_name]:
-            print(f"❌ Only {self.pending_repairs[blueprint_name]} units need repair")
+        if quantity > pending:
+            self._print(f"❌ Only {pending} units need repair")
             return False
 
         # Find the blueprint
-        blueprint = None
-        for bp in self.blueprints:
-            if bp.name == blueprint_name:
-                blueprint = bp
-                break
+        blueprint = self.get_blueprint(blueprint_name)
 
         if not blueprint:
-            print(f"❌ Blueprint '{blueprint_name}' not found!")
+            self._print(f"❌ Blueprint '{blueprint_name}' not found!")
             return False
 
         # Calculate repair cost
@@ -990,20 +1267,19 @@ class Player:
 
         # Check funds
         if self.money < total_cost:
-            print(f"❌ Insufficient funds. Need ${total_cost:,}, have ${self.money:,}")
+            self._print(f"❌ Insufficient funds. Need ${total_cost:,}, have ${self.money:,}")
             return False
 
-        # Complete the repair
+        # Complete the repair, removing the entry if none are left
         self.money -= total_cost
-        self.pending_repairs[blueprint_name] -= quantity
-
-        # Remove from pending if none left
-        if self.pending_repairs[blueprint_name] <= 0:
+        if pending - quantity <= 0:
             del self.pending_repairs[blueprint_name]
+        else:
+            self.pending_repairs[blueprint_name] = pending - quantity
 
-        print(f"\n✓ Repaired {quantity}x {blueprint_name}")
-        print(f"  Repair cost: ${total_cost:,}")
-        print(f"  Remaining balance: ${self.money:,}")
+        self._print(f"\n✓ Repaired {quantity}x {blueprint_name}")
+        self._print(f"  Repair cost: ${total_cost:,}")
+        self._print(f"  Remaining balance: ${self.money:,}")
         return True
 
     def repair_all_devices(self) -> bool:
@@ -1012,18 +1288,14 @@ class Player:
         Returns True if successful, False otherwise.
         """
         if not self.pending_repairs:
-            print("❌ No pending repairs")
+            self._print("❌ No pending repairs")
             return False
 
         # Calculate total cost
         total_cost = 0
         repair_list = []
         for blueprint_name, quantity in self.pending_repairs.items():
-            blueprint = None
-            for bp in self.blueprints:
-                if bp.name == blueprint_name:
-                    blueprint = bp
-                    break
+            blueprint = self.get_blueprint(blueprint_name)
             if blueprint:
                 repair_cost = blueprint.get_repair_cost() * quantity
                 total_cost += repair_cost
@@ -1031,18 +1303,18 @@ class Player:
 
         # Check funds
         if self.money < total_cost:
-            print(f"❌ Insufficient funds. Need ${total_cost:,}, have ${self.money:,}")
+            self._print(f"❌ Insufficient funds. Need ${total_cost:,}, have ${self.money:,}")
             return False
 
         # Complete all repairs
         self.money -= total_cost
         self.pending_repairs.clear()
 
-        print(f"\n✓ Repaired all devices:")
+        self._print(f"\n✓ Repaired all devices:")
         for blueprint_name, quantity, cost in repair_list:
-            print(f"  - {quantity}x {blueprint_name}: ${cost:,}")
-        print(f"\n  Total repair cost: ${total_cost:,}")
-        print(f"  Remaining balance: ${self.money:,}")
+            self._print(f"  - {quantity}x {blueprint_name}: ${cost:,}")
+        self._print(f"\n  Total repair cost: ${total_cost:,}")
+        self._print(f"  Remaining balance: ${self.money:,}")
         return True
 
     def reject_repairs(self, blueprint_name: str, quantity: int) -> bool:
@@ -1053,32 +1325,32 @@ class Player:
         Returns True if successful, False otherwise.
         """
         # Check if there are pending repairs for this blueprint
-        if blueprint_name not in self.pending_repairs or self.pending_repairs[blueprint_name] <= 0:
-            print(f"❌ No pending repairs for {blueprint_name}")
+        pending = self.pending_repairs.get(blueprint_name, 0)
+        if pending <= 0:
+            self._print(f"❌ No pending repairs for {blueprint_name}")
             return False
 
         # Check quantity
         if quantity <= 0:
-            print(f"❌ Invalid quantity: {quantity}")
+            self._print(f"❌ Invalid quantity: {quantity}")
             return False
 
-        if quantity > self.pending_repairs[blueprint_name]:
-            print(f"❌ Only {self.pending_repairs[blueprint_name]} units pending repair")
+        if quantity > pending:
+            self._print(f"❌ Only {pending} units pending repair")
             return False
 
-        # Reject the repairs
-        self.pending_repairs[blueprint_name] -= quantity
-
-        # Remove from pending if none left
-        if self.pending_repairs[blueprint_name] <= 0:
+        # Reject the repairs, removing the entry if none are left
+        if pending - quantity <= 0:
             del self.pending_repairs[blueprint_name]
+        else:
+            self.pending_repairs[blueprint_name] = pending - quantity
 
         # Track rejected repairs for brand penalty (applied at month end)
         self.rejected_repairs_this_month += quantity
 
-        print(f"\n⚠️  Rejected repairs for {quantity}x {blueprint_name}")
-        print(f"  Brand reputation will be affected (-1 per device, max -10 per month)")
-        print(f"  Total rejected this month: {self.rejected_repairs_this_month}")
+        self._print(f"\n⚠️  Rejected repairs for {quantity}x {blueprint_name}")
+        self._print(f"  Brand reputation will be affected (-1 per device, max -10 per month)")
+        self._print(f"  Total rejected this month: {self.rejected_repairs_this_month}")
         return True
 
     def calculate_brand_reputation_changes(self, global_tech_level: int):
@@ -1181,52 +1453,82 @@ class Player:
 
         # Display changes if any
         if reputation_changes:
-            print(f"\n📊 Brand Reputation Changes for {self.name}:")
+            self._print(f"\n📊 Brand Reputation Changes for {self.name}:")
             for change in reputation_changes:
-                print(change)
-            print(f"  Total change: {total_change:+.1f}")
-            print(f"  Brand reputation: {old_reputation:.1f} → {self.brand_reputation:.1f}")
+                self._print(change)
+            self._print(f"  Total change: {total_change:+.1f}")
+            self._print(f"  Brand reputation: {old_reputation:.1f} → {self.brand_reputation:.1f}")
 
         return total_change
 
     def track_blueprint_price(self, blueprint_name: str, price: int):
         """Track price history for a blueprint"""
-        if blueprint_name not in self.price_history:
-            self.price_history[blueprint_name] = []
+        history = self.price_history.setdefault(blueprint_name, [])
 
         # Add current month and price
-        self.price_history[blueprint_name].append((self.current_month, price))
+        history.append((self.current_month, price))
 
         # Keep only last 3 months of history
-        if len(self.price_history[blueprint_name]) > 3:
-            self.price_history[blueprint_name] = self.price_history[blueprint_name][-3:]
+        if len(history) > 3:
+            del history[:-3]
 
 
 class CustomerMarket:
     """Manages the customer market with persistent phone ownership tracking"""
 
+    __slots__ = ('customer_groups', 'current_month', 'sales_history', 'is_initialized', 'verbose')
+
     def __init__(self):
         self.customer_groups: List[CustomerGroup] = []
         self.current_month = 0
         self.sales_history: Dict[int, Dict[str, int]] = {}  # month -> {player_name: sales_count}
         self.is_initialized = False
+        self.verbose = True  # Print market reports (off for headless runs)
+
+    def _print(self, *args, **kwargs):
+        """print() for market reports, silenced when verbose is off"""
+        if self.verbose:
+            print(*args, **kwargs)
 
     def to_dict(self):
         """Convert market to dictionary"""
         return {
-            'customer_groups': [g.to_dict() for g in self.customer_groups],
+            'customer_groups': [g.to_row() for g in self.customer_groups],
+            **self._state_without_groups(),
+        }
+
+    def _state_without_groups(self):
+        """Everything in to_dict() except the customer groups, in the same key order"""
+        return {
             'current_month': self.current_month,
             'sales_history': self.sales_history,
             'is_initialized': self.is_initialized,
         }
 
+    def write_json(self, f, pretty: bool = False, depth: int = 0):
+        """
+        Stream to_dict() as JSON, encoding one customer group at a time.
+        depth is the nesting level of the market object within the save.
+        """
+        indent, colon = (b'\n' + b'  ' * (depth + 1), b': ') if pretty else (b'', b':')
+        f.write(b'{' + indent + b'"customer_groups"' + colon)
+        _write_json_array(f, (g.to_row() for g in self.customer_groups), pretty, depth + 1)
+        for key, value in self._state_without_groups().items():
+            f.write(b',' + indent + _encode_json(key) + colon + _encode_json_at(value, pretty, depth + 1))
+        f.write(b'\n' + b'  ' * depth + b'}' if pretty else b'}')
+
     @staticmethod
     def from_dict(data):
         """Load market from dictionary"""
         market = CustomerMarket()
-        market.customer_groups = [CustomerGroup.from_dict(g) for g in data.get('customer_groups', [])]
+        # Groups are saved as rows; older saves stored one dict per group
+        market.customer_groups = [
+            CustomerGroup.from_dict(g) if isinstance(g, dict) else CustomerGroup.from_row(g)
+            for g in data.get('customer_groups', [])
+        ]
         market.current_month = data.get('current_month', 0)
-        market.sales_history = data.get('sales_history', {})
+        # JSON turns the integer month keys into strings, so convert them back
+        market.sales_history = {int(month): sales for month, sales in data.get('sales_history', {}).items()}
         market.is_initialized = data.get('is_initialized', False)
         return market
 
@@ -1236,14 +1538,15 @@ class CustomerMarket:
         Everyone starts without owning a phone.
         """
         if self.is_initialized:
-            print("\n⚠️  Market already initialized!")
+            self._print("\n⚠️  Market already initialized!")
             return
 
-        print(f"\n📊 Initializing market with {MARKET_SIZE} people...")
+        self._print(f"\n📊 Initializing market with {MARKET_SIZE} people...")
 
         # Create customer groups distributed by tier and type
-        customer_types_list = list(CUSTOMER_TYPES.keys())
-        num_types = len(customer_types_list)
+        num_types = len(CUSTOMER_TYPE_NAMES)
+        tier_totals = {}
+        type_totals = dict.fromkeys(CUSTOMER_TYPE_NAMES, 0)
 
         for tier_name, tier_percentage in CUSTOMER_TIER_DISTRIBUTION.items():
             tier_count = int(MARKET_SIZE * tier_percentage)
@@ -1252,9 +1555,11 @@ class CustomerMarket:
             customers_per_type = tier_count // num_types
             remainder = tier_count % num_types
 
-            for i, customer_type in enumerate(customer_types_list):
+            tier_totals[tier_name] = tier_count
+            for i, customer_type in enumerate(CUSTOMER_TYPE_NAMES):
                 # Add remainder to first few types to reach exact count
                 count = customers_per_type + (1 if i < remainder else 0)
+                type_totals[customer_type] += count
 
                 if count > 0:
                     group = CustomerGroup(
@@ -1266,20 +1571,18 @@ class CustomerMarket:
 
         self.is_initialized = True
 
-        print(f"  ✓ Created {len(self.customer_groups)} customer groups")
-        print(f"  Total people: {sum(g.count for g in self.customer_groups)}")
+        self._print(f"  ✓ Created {len(self.customer_groups)} customer groups")
+        self._print(f"  Total people: {sum(g.count for g in self.customer_groups)}")
 
         # Display distribution
-        print("\n  Distribution by tier:")
+        self._print("\n  Distribution by tier:")
         for tier_name, percentage in CUSTOMER_TIER_DISTRIBUTION.items():
-            count = sum(g.count for g in self.customer_groups if g.tier == tier_name)
-            print(f"    {tier_name}: {count} ({percentage*100:.0f}%)")
+            self._print(f"    {tier_name}: {tier_totals[tier_name]} ({percentage*100:.0f}%)")
 
-        print("\n  Distribution by type:")
-        for customer_type in customer_types_list:
-            count = sum(g.count for g in self.customer_groups if g.customer_type == customer_type)
+        self._print("\n  Distribution by type:")
+        for customer_type, count in type_totals.items():
             percentage = (count / MARKET_SIZE * 100) if MARKET_SIZE > 0 else 0
-            print(f"    {customer_type}: {count} ({percentage:.1f}%)")
+            self._print(f"    {customer_type}: {count} ({percentage:.1f}%)")
 
     def calculate_phone_lifecycle(self, blueprint: 'PhoneBlueprint', customer_type: str) -> int:
         """
@@ -1309,19 +1612,7 @@ class CustomerMarket:
 
         # Count parts by tier (T3 is baseline midrange)
         tier_bonus = 0
-        parts_tiers = [
-            blueprint.ram_tier,
-            blueprint.soc_tier,
-            blueprint.screen_tier,
-            blueprint.battery_tier,
-            blueprint.camera_tier,
-            blueprint.casing_tier,
-            blueprint.storage_tier,
-        ]
-        if blueprint.fingerprint_tier > 0:
-            parts_tiers.append(blueprint.fingerprint_tier)
-
-        for tier in parts_tiers:
+        for tier in blueprint._part_tiers:
             if tier >= 4:  # T4 and above
                 tier_bonus += 1
             elif tier <= 2:  # T2 and below
@@ -1329,19 +1620,7 @@ class CustomerMarket:
 
         # Count quality bonuses/penalties
         quality_bonus = 0
-        parts_qualities = [
-            blueprint.ram_quality,
-            blueprint.soc_quality,
-            blueprint.screen_quality,
-            blueprint.battery_quality,
-            blueprint.camera_quality,
-            blueprint.casing_quality,
-            blueprint.storage_quality,
-        ]
-        if blueprint.fingerprint_tier > 0:
-            parts_qualities.append(blueprint.fingerprint_quality)
-
-        for quality in parts_qualities:
+        for quality in blueprint._part_qualities:
             if quality == "High":
                 quality_bonus += 1
             elif quality == "Low":
@@ -1357,54 +1636,57 @@ class CustomerMarket:
         # Enforce lifecycle constraints: minimum 6 months, maximum 30 months
         return max(6, min(30, total_lifecycle))
 
-    def display_customer_breakdown(self):
-        """Display breakdown of customers by tier, type, and phone ownership"""
-        total_people = sum(g.count for g in self.customer_groups)
-
-        print(f"\n📊 Customer Market Analysis (Month {self.current_month}):")
-        print(f"  Total people: {total_people}")
-
-        # Count by tier
-        tier_counts = {}
+    def get_customer_breakdown_lines(self) -> List[str]:
+        """Build the lines breaking down customers by tier, type, and phone ownership"""
+        # Tally everything in a single pass over the groups
+        tier_counts = Counter()
+        type_counts = Counter()
+        company_counts = Counter()
+        people_with_phones = 0
         for group in self.customer_groups:
-            tier_counts[group.tier] = tier_counts.get(group.tier, 0) + group.count
+            tier_counts[group.tier] += group.count
+            type_counts[group.customer_type] += group.count
+            if group.owned_phone_company is not None:
+                people_with_phones += group.count
+                if group.owned_phone_company:
+                    company_counts[group.owned_phone_company] += group.count
+        total_people = sum(tier_counts.values())
 
-        print("\n  By Tier:")
-        for tier in ['Entry Level', 'Budget', 'Midrange', 'High End', 'Flagship']:
-            count = tier_counts.get(tier, 0)
-            percentage = (count / total_people * 100) if total_people > 0 else 0
-            print(f"    {tier}: {count} ({percentage:.1f}%)")
+        lines = [
+            f"\n📊 Customer Market Analysis (Month {self.current_month}):",
+            f"  Total people: {total_people}",
+        ]
 
-        # Count by type
-        type_counts = {}
-        for group in self.customer_groups:
-            type_counts[group.customer_type] = type_counts.get(group.customer_type, 0) + group.count
+        lines.append("\n  By Tier:")
+        for tier in TIER_NAMES:
+            count = tier_counts[tier]
+            percentage = (count / total_people * 100) if total_people > 0 else 0
+            lines.append(f"    {tier}: {count} ({percentage:.1f}%)")
 
-        print("\n  By Type:")
-        for customer_type in sorted(CUSTOMER_TYPES.keys()):
-            count = type_counts.get(customer_type, 0)
+        lines.append("\n  By Type:")
+        for customer_type in sorted(CUSTOMER_TYPE_NAMES):
+            count = type_counts[customer_type]
             percentage = (count / total_people * 100) if total_people > 0 else 0
-            print(f"    {customer_type}: {count} ({percentage:.1f}%)")
+            lines.append(f"    {customer_type}: {count} ({percentage:.1f}%)")
 
-        # Count phone ownership
-        people_with_phones = sum(g.count for g in self.customer_groups if g.owned_phone_company is not None)
+        # Phone ownership
         people_without_phones = total_people - people_with_phones
 
-        print("\n  Phone Ownership:")
-        print(f"    With phones: {people_with_phones} ({people_with_phones/total_people*100:.1f}%)")
-        print(f"    Without phones: {people_without_phones} ({people_without_phones/total_people*100:.1f}%)")
+        lines.append("\n  Phone Ownership:")
+        lines.append(f"    With phones: {people_with_phones} ({people_with_phones/total_people*100:.1f}%)")
+        lines.append(f"    Without phones: {people_without_phones} ({people_without_phones/total_people*100:.1f}%)")
 
         # Show market share by company
         if people_with_phones > 0:
-            company_counts = {}
-            for group in self.customer_groups:
-                if group.owned_phone_company:
-                    company_counts[group.owned_phone_company] = company_counts.get(group.owned_phone_company, 0) + group.count
-
-            print("\n  Market Share:")
-            for company, count in sorted(company_counts.items(), key=lambda x: x[1], reverse=True):
+            lines.append("\n  Market Share:")
+            for company, count in company_counts.most_common():
                 percentage = (count / people_with_phones * 100) if people_with_phones > 0 else 0
-                print(f"    {company}: {count} ({percentage:.1f}%)")
+                lines.append(f"    {company}: {count} ({percentage:.1f}%)")
+        return lines
+
+    def display_customer_breakdown(self):
+        """Display breakdown of customers by tier, type, and phone ownership"""
+        write_lines(self.get_customer_breakdown_lines())
 
     def consolidate_customer_groups(self):
         """
@@ -1434,36 +1716,29 @@ class CustomerMarket:
                 group.purchase_month
             )
 
-            if key in merged_groups:
-                # Merge into existing group
-                merged_groups[key].count += group.count
-                # Keep the most recent camera check month
-                if group.last_camera_check_month is not None:
-                    if merged_groups[key].last_camera_check_month is None:
-                        merged_groups[key].last_camera_check_month = group.last_camera_check_month
-                    else:
-                        merged_groups[key].last_camera_check_month = max(
-                            merged_groups[key].last_camera_check_month,
-                            group.last_camera_check_month
-                        )
-            else:
-                # Create new merged group entry
-                merged_groups[key] = CustomerGroup(
-                    tier=group.tier,
-                    customer_type=group.customer_type,
-                    count=group.count,
-                    owned_phone_company=group.owned_phone_company,
-                    owned_phone_blueprint=group.owned_phone_blueprint,
-                    purchase_month=group.purchase_month,
-                    last_camera_check_month=group.last_camera_check_month
-                )
+            merged = merged_groups.get(key)
+            if merged is None:
+                # First group with this key - keep the object itself and merge the rest into it
+                merged_groups[key] = group
+                continue
+
+            merged.count += group.count
+            # Keep the most recent camera check month
+            if group.last_camera_check_month is not None:
+                if merged.last_camera_check_month is None:
+                    merged.last_camera_check_month = group.last_camera_check_month
+                else:
+                    merged.last_camera_check_month = max(
+                        merged.last_camera_check_month,
+                        group.last_camera_check_month
+                    )
 
         # Replace customer groups with merged version
         self.customer_groups = list(merged_groups.values())
 
         final_count = len(self.customer_groups)
         if initial_count != final_count:
-            print(f"  🔄 Consolidated customer groups: {initial_count} → {final_count} (merged {initial_count - final_count} groups)")
+            self._print(f"  🔄 Consolidated customer groups: {initial_count} → {final_count} (merged {initial_count - final_count} groups)")
 
     def simulate_purchases(self, players: List[Player], global_tech_level: int):
         """
@@ -1473,37 +1748,45 @@ class CustomerMarket:
         2. Their phone's lifecycle has expired, OR
         3. (Camera Enthusiast only) A better camera tier is available
         """
-        print(f"\n🛒 Simulating customer purchases for Month {self.current_month}...")
+        self._print(f"\n🛒 Simulating customer purchases for Month {self.current_month}...")
 
-        # Build blueprint lookup for all players
-        player_blueprints = {}  # player_name -> {blueprint_name -> blueprint}
-        for player in players:
-            player_blueprints[player.name] = {}
-            for bp in player.blueprints:
-                player_blueprints[player.name][bp.name] = bp
+        players_by_name = {player.name: player for player in players}
 
         # Collect all available phones from all players
+        # (their stock stays in player.manufactured_phones, which purchases draw down directly)
         available_phones = []  # List of (player, blueprint)
-        inventory_tracker = {}  # (player_name, blueprint_name) -> available_count
         for player in players:
             for phone_name, quantity in player.manufactured_phones.items():
                 if quantity > 0:
-                    blueprint = player_blueprints[player.name].get(phone_name)
+                    blueprint = player.get_blueprint(phone_name)
                     if blueprint:
                         available_phones.append((player, blueprint))
-                        inventory_tracker[(player.name, phone_name)] = quantity
 
         if not available_phones:
-            print("  ❌ No phones available for purchase!")
+            self._print("  ❌ No phones available for purchase!")
             return
 
+        # Score every phone once per customer type (with its brand bonus) instead of once per group,
+        # and bucket the phones by market tier
+        phone_scores = {}  # (player_name, blueprint_name) -> {customer_type -> score}
+        phones_by_tier = defaultdict(list)  # tier name -> [(player, blueprint)]
+        for player, blueprint in available_phones:
+            phones_by_tier[blueprint.get_tier_name(global_tech_level)].append((player, blueprint))
+            brand_multiplier = 1.0 + (player.brand_reputation / 100.0 * 0.2)
+            phone_scores[(player.name, blueprint.name)] = {
+                customer_type: score * brand_multiplier
+                for customer_type, score in blueprint._type_scores.items()
+            }
+
         # Track sales for this month
         sales_by_player = {}
+        revenue_by_player = {}
         for player in players:
             sales_by_player[player.name] = 0
+            revenue_by_player[player.name] = 0
 
         # Track sales by phone
-        sales_by_phone = {}  # (player_name, phone_name) -> count
+        sales_by_phone = Counter()  # (player_name, phone_name) -> count
 
         # Track brand reputation changes based on retention
         retention_changes = {}  # player_name -> change
@@ -1512,6 +1795,7 @@ class CustomerMarket:
 
         # Process each customer group
         groups_to_split = []  # Groups that need to be split due to purchases
+        best_phones = {}  # (tier, customer_type) -> (player, blueprint), (None, None) if no phone matches
 
         for group_idx, group in enumerate(self.customer_groups):
             # Determine if this group should buy phones this month
@@ -1526,8 +1810,9 @@ class CustomerMarket:
 
                 # Get the blueprint they own
                 owned_blueprint = None
-                if group.owned_phone_company in player_blueprints:
-                    owned_blueprint = player_blueprints[group.owned_phone_company].get(group.owned_phone_blueprint)
+                owner = players_by_name.get(group.owned_phone_company)
+                if owner is not None:
+                    owned_blueprint = owner.get_blueprint(group.owned_phone_blueprint)
 
                 if owned_blueprint:
                     lifecycle = self.calculate_phone_lifecycle(owned_blueprint, group.customer_type)
@@ -1551,9 +1836,8 @@ class CustomerMarket:
                             current_camera_tier = owned_blueprint.camera_tier
 
                             # Check if any available phone has better camera
-                            for player, blueprint in available_phones:
-                                phone_tier = blueprint.get_tier_name(global_tech_level)
-                                if phone_tier == group.tier and blueprint.camera_tier > current_camera_tier:
+                            for player, blueprint in phones_by_tier[group.tier]:
+                                if blueprint.camera_tier > current_camera_tier:
                                     should_buy_count = group.count
                                     # Track retention (switching before lifecycle)
                                     if months_owned <= 12:
@@ -1567,58 +1851,48 @@ class CustomerMarket:
             if should_buy_count == 0:
                 continue
 
-            # Find phones matching this group's tier
-            matching_phones = []
-            for player, blueprint in available_phones:
-                phone_tier = blueprint.get_tier_name(global_tech_level)
-                if phone_tier == group.tier:
-                    matching_phones.append((player, blueprint))
+            # Groups sharing a tier and customer type all rank phones the same way,
+            # so the best phone is picked once per (tier, type) pair
+            best_key = (group.tier, group.customer_type)
+            if best_key not in best_phones:
+                # Evaluate each phone matching this group's tier
+                best_phone = None
+                best_score = -float('inf')
+                best_player = None
 
-            if not matching_phones:
-                continue  # No phones available in this tier
+                for player, blueprint in phones_by_tier[group.tier]:
+                    score = phone_scores[(player.name, blueprint.name)][group.customer_type]
 
-            # Evaluate each phone based on group preferences
-            best_phone = None
-            best_score = -float('inf')
-            best_player = None
+                    if score > best_score:
+                        best_score = score
+                        best_phone = blueprint
+                        best_player = player
 
-            for player, blueprint in matching_phones:
-                score = group.evaluate_phone(blueprint)
+                best_phones[best_key] = (best_player, best_phone)
 
-                # Apply brand reputation bonus
-                brand_multiplier = 1.0 + (player.brand_reputation / 100.0 * 0.2)
-                score *= brand_multiplier
-
-                if score > best_score:
-                    best_score = score
-                    best_phone = blueprint
-                    best_player = player
+            best_player, best_phone = best_phones[best_key]
 
             # Purchase phones for this group
             if best_phone and best_player:
-                inventory_key = (best_player.name, best_phone.name)
-                available_qty = inventory_tracker.get(inventory_key, 0)
+                available_qty = best_player.manufactured_phones[best_phone.name]
 
                 if available_qty > 0:
                     # Determine how many can actually buy (limited by inventory)
                     actual_buy_count = min(should_buy_count, available_qty)
 
                     # Complete the purchases
+                    revenue = best_phone.sell_price * actual_buy_count
                     best_player.manufactured_phones[best_phone.name] -= actual_buy_count
-                    best_player.money += best_phone.sell_price * actual_buy_count
+                    best_player.money += revenue
 
                     # Track sold devices for repair calculations
-                    if best_phone.name not in best_player.sold_devices:
-                        best_player.sold_devices[best_phone.name] = 0
                     best_player.sold_devices[best_phone.name] += actual_buy_count
 
                     # Track sales
                     sales_by_player[best_player.name] += actual_buy_count
+                    revenue_by_player[best_player.name] += revenue
                     key = (best_player.name, best_phone.name)
-                    sales_by_phone[key] = sales_by_phone.get(key, 0) + actual_buy_count
-
-                    # Update inventory tracker
-                    inventory_tracker[inventory_key] -= actual_buy_count
+                    sales_by_phone[key] += actual_buy_count
 
                     # Handle group splitting if needed
                     if actual_buy_count < group.count:
@@ -1658,63 +1932,143 @@ class CustomerMarket:
             if change != 0:
                 player.brand_reputation = max(0, min(100, player.brand_reputation + change))
                 if change < 0:
-                    print(f"  ⚠️  {player.name} brand reputation: {change} (poor retention <12 months)")
+                    self._print(f"  ⚠️  {player.name} brand reputation: {change} (poor retention <12 months)")
                 else:
-                    print(f"  ✓ {player.name} brand reputation: +{change} (good retention ≥24 months)")
+                    self._print(f"  ✓ {player.name} brand reputation: +{change} (good retention ≥24 months)")
 
         # Store sales history
         self.sales_history[self.current_month] = sales_by_player
 
         # Display results
-        print(f"\n💰 Sales Results for Month {self.current_month}:")
+        self._print(f"\n💰 Sales Results for Month {self.current_month}:")
         total_sales = 0
         total_people = sum(g.count for g in self.customer_groups)
 
         for player in players:
             sales = sales_by_player[player.name]
             total_sales += sales
-            revenue = sum(
-                sales_by_phone.get((player.name, bp.name), 0) * bp.sell_price
-                for bp in player.blueprints
-            )
-            print(f"  {player.name}: {sales} phones sold, ${revenue:,} revenue")
+            self._print(f"  {player.name}: {sales} phones sold, ${revenue_by_player[player.name]:,} revenue")
 
         people_with_phones = sum(g.count for g in self.customer_groups if g.owned_phone_company is not None)
-        print(f"\n  Total sales: {total_sales} phones")
-        print(f"  Market penetration: {people_with_phones}/{total_people} ({people_with_phones/total_people*100:.1f}%) own phones")
+        self._print(f"\n  Total sales: {total_sales} phones")
+        self._print(f"  Market penetration: {people_with_phones}/{total_people} ({people_with_phones/total_people*100:.1f}%) own phones")
 
         # Show detailed breakdown by phone
         if sales_by_phone:
-            print(f"\n  Sales by phone model:")
-            for (player_name, phone_name), count in sorted(sales_by_phone.items(), key=lambda x: x[1], reverse=True):
-                print(f"    {player_name} - {phone_name}: {count} units")
+            self._print(f"\n  Sales by phone model:")
+            for (player_name, phone_name), count in sales_by_phone.most_common():
+                self._print(f"    {player_name} - {phone_name}: {count} units")
 
         # Consolidate customer groups to prevent proliferation
         self.consolidate_customer_groups()
 
 
+def _encode_json(value, pretty: bool = False) -> bytes:
+    """Encode a value as compact JSON, or indented when pretty (with orjson when it is installed)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(value, option=option)
+    # Like orjson, write non-ASCII text as UTF-8 rather than \u escapes
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode()
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def _encode_json_at(value, pretty: bool, depth: int) -> bytes:
+    """Encode a value as JSON for nesting at the given depth (pretty output is re-indented)"""
+    data = _encode_json(value, pretty)
+    return data.replace(b'\n', b'\n' + b'  ' * depth) if pretty and depth else data
+
+
+def _write_json_array(f, items, pretty: bool, depth: int):
+    """Stream a JSON array at the given nesting depth, encoding one item at a time"""
+    indent = b'\n' + b'  ' * (depth + 1) if pretty else b''
+    separator = b'[' + indent
+    for item in items:
+        f.write(separator + _encode_json_at(item, pretty, depth + 1))
+        separator = b',' + indent
+    if separator[:1] == b'[':
+        f.write(b'[]')  # Nothing was written
+    else:
+        f.write(b'\n' + b'  ' * depth + b']' if pretty else b']')
+
+
+def _import_msgpack(error: str):
+    """Import msgpack on first use - it is optional and only .msgpack saves need it"""
+    try:
+        import msgpack
+    except ImportError:
+        raise RuntimeError(error) from None
+    return msgpack
+
+
+def _encode_msgpack(value) -> bytes:
+    """Encode a value as MessagePack"""
+    msgpack = _import_msgpack("the msgpack package is required for .msgpack saves")
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _decode_save_data(raw: bytes) -> dict:
+    """Decode a save file, detecting gzip, JSON (starts with '{') or MessagePack"""
+    if raw[:2] == b'\x1f\x8b':
+        import gzip  # Only compressed saves need it
+        raw = gzip.decompress(raw)
+    if raw.lstrip()[:1] == b'{':
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    msgpack = _import_msgpack("the msgpack package is required to load this save")
+    # Sales history is keyed by month number
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+
 class Game:
     """Main game controller"""
 
+    __slots__ = (
+        'players', 'current_player_index', 'global_month', 'global_tech_level',
+        'min_tier', 'max_tier', 'months_until_tech_advance', 'customer_market',
+        'players_ready_mask', 'verbose', '_tech_banner',
+    )
+
     def __init__(self):
         self.players: List[Player] = []
         self.current_player_index = 0
         self.global_month = 1  # Global game month
         self.global_tech_level = 1  # Determines which 5 tiers are available (1 = tiers 1-5, 2 = tiers 2-6, etc.)
+        # Tier range available at global_tech_level, updated when it changes
+        self.min_tier = 1
+        self.max_tier = 5
         self.months_until_tech_advance = 36  # Tech advances every 3 years (36 months)
         self.customer_market = CustomerMarket()  # Customer market
-        self.players_ready_for_next_month = set()  # Track which players have advanced this turn
+        self.players_ready_mask = 0  # Bit i is set once player i has advanced this turn
+        self.verbose = True  # Print month reports (off for headless runs)
+        self._tech_banner = (None, [])  # (month/tech state it was built for, main menu banner lines)
+
+    def _print(self, *args, **kwargs):
+        """print() for month reports, silenced when verbose is off"""
+        if self.verbose:
+            print(*args, **kwargs)
 
     def to_dict(self):
         """Convert game state to dictionary"""
-        return {
+        state = {
             'players': [p.to_dict() for p in self.players],
+            **self._state_without_players(),
+        }
+        state['customer_market'] = self.customer_market.to_dict()
+        return state
+
+    def _state_without_players(self):
+        """
+        Everything in to_dict() except the player list, in the same key order.
+        The customer market is left as the object itself so saves can stream it.
+        """
+        return {
             'current_player_index': self.current_player_index,
             'global_month': self.global_month,
             'global_tech_level': self.global_tech_level,
             'months_until_tech_advance': self.months_until_tech_advance,
-            'customer_market': self.customer_market.to_dict(),
-            'players_ready_for_next_month': list(self.players_ready_for_next_month),
+            'customer_market': self.customer_market,
+            'players_ready_mask': self.players_ready_mask,
         }
 
     @staticmethod
@@ -1725,104 +2079,139 @@ class Game:
         game.current_player_index = data['current_player_index']
         game.global_month = data.get('global_month', 1)
         game.global_tech_level = data.get('global_tech_level', 1)
+        game.min_tier = game.global_tech_level
+        game.max_tier = game.global_tech_level + 4
         game.months_until_tech_advance = data.get('months_until_tech_advance', 36)
         if 'customer_market' in data:
             game.customer_market = CustomerMarket.from_dict(data['customer_market'])
         else:
             game.customer_market = CustomerMarket()
-        game.players_ready_for_next_month = set(data.get('players_ready_for_next_month', []))
+        if 'players_ready_mask' in data:
+            game.players_ready_mask = data['players_ready_mask']
+        else:
+            # Older saves list the names of the ready players
+            ready_names = set(data.get('players_ready_for_next_month', []))
+            game.players_ready_mask = sum(
+                1 << i for i, player in enumerate(game.players) if player.name in ready_names
+            )
         return game
 
     def get_available_tier_range(self):
         """Get the current available tier range (min_tier, max_tier)"""
-        min_tier = self.global_tech_level
-        max_tier = self.global_tech_level + 4
-        return min_tier, max_tier
+        return self.min_tier, self.max_tier
+
+    def get_tech_banner_lines(self) -> List[str]:
+        """Build the month and tech level lines shown above the main menu (cached until they change)"""
+        state = (self.global_month, self.global_tech_level, self.months_until_tech_advance)
+        if self._tech_banner[0] != state:
+            years_remaining, months_remaining = divmod(self.months_until_tech_advance, 12)
+
+            if years_remaining > 0:
+                tech_advance = f"⏳ Next tech advancement: {years_remaining}y {months_remaining}m"
+            else:
+                tech_advance = f"⏳ Next tech advancement: {months_remaining}m"
+
+            self._tech_banner = (state, [
+                f"\n📅 Global Month: {self.global_month}",
+                f"🔬 Tech Level: T{self.min_tier}-T{self.max_tier}",
+                tech_advance,
+            ])
+        return self._tech_banner[1]
 
     def advance_global_tech(self):
         """Advance the global tech level (called every 36 months)"""
-        old_min, old_max = self.get_available_tier_range()
+        old_min = self.min_tier
         self.global_tech_level += 1
-        new_min, new_max = self.get_available_tier_range()
+        self.min_tier = new_min = self.global_tech_level
+        self.max_tier = new_max = self.global_tech_level + 4
 
-        print(f"\n{'='*60}")
-        print(f"🚀 GLOBAL TECH ADVANCEMENT!")
-        print(f"{'='*60}")
-        print(f"Technology has advanced! Tier {old_min} components are now obsolete.")
-        print(f"New tier range: T{new_min} - T{new_max}")
-        print(f"All players now have access to the new tier T{new_max}")
-        print(f"{'='*60}")
+        self._print(f"\n{'='*60}")
+        self._print(f"🚀 GLOBAL TECH ADVANCEMENT!")
+        self._print(f"{'='*60}")
+        self._print(f"Technology has advanced! Tier {old_min} components are now obsolete.")
+        self._print(f"New tier range: T{new_min} - T{new_max}")
+        self._print(f"All players now have access to the new tier T{new_max}")
+        self._print(f"{'='*60}")
 
         # Update all players' unlocked tiers to include the new tier
+        # Ensure all parts are at least at the new max tier
         for player in self.players:
-            for part in ALL_PARTS:
-                # Ensure all parts are at least at the new max tier
-                if player.unlocked_tiers[part] < new_max:
-                    player.unlocked_tiers[part] = new_max
+            player.unlocked_tiers = [max(tier, new_max) for tier in player.unlocked_tiers]
 
     def advance_game_month(self):
         """Advance the game month - happens when all players are ready"""
-        print(f"\n{'='*60}")
-        print(f"END OF MONTH {self.global_month} REPORT")
-        print(f"{'='*60}")
+        if not self.verbose:
+            self._advance_game_month()
+            return
+
+        # The report is collected from the game, market and players and
+        # written out in one go instead of one print call per line
+        report = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(report):
+                self._advance_game_month()
+        finally:
+            sys.stdout.write(report.getvalue())
+
+    def _advance_game_month(self):
+        """Run the end of month steps, printing the month report"""
+        self._print(f"\n{'='*60}")
+        self._print(f"END OF MONTH {self.global_month} REPORT")
+        self._print(f"{'='*60}")
 
         # 1. Simulate customer purchases for current month (BEFORE manufacturing completes)
         if self.customer_market.customer_groups:
             self.customer_market.simulate_purchases(self.players, self.global_tech_level)
         else:
-            print("\n❌ No customer data yet. Market needs to be initialized.")
+            self._print("\n❌ No customer data yet. Market needs to be initialized.")
 
         # 2. Complete manufacturing for all players (AFTER sales)
-        print(f"\n--- Manufacturing Completion ---")
+        self._print(f"\n--- Manufacturing Completion ---")
         any_manufacturing = False
         for player in self.players:
             completed = player.complete_manufacturing()
             if completed:
                 any_manufacturing = True
-                print(f"\n📦 {player.name} - Manufacturing Completed:")
+                self._print(f"\n📦 {player.name} - Manufacturing Completed:")
                 for name, qty in completed:
-                    print(f"  - {qty}x {name} ready to sell!")
+                    self._print(f"  - {qty}x {name} ready to sell!")
 
         if not any_manufacturing:
-            print("  No manufacturing completed this month.")
+            self._print("  No manufacturing completed this month.")
 
         # 3. Advance global month
         self.global_month += 1
         self.months_until_tech_advance -= 1
 
-        print(f"\n{'='*60}")
-        print(f"✓ Advanced to Month {self.global_month}")
-        print(f"{'='*60}")
+        self._print(f"\n{'='*60}")
+        self._print(f"✓ Advanced to Month {self.global_month}")
+        self._print(f"{'='*60}")
 
-        # 4. Advance each player's month (R&D progress, reset limits)
+        # 4. Advance each player's month (R&D progress, reset limits) and
+        # 4.5. generate repair returns in the same pass; the repair report is
+        # collected and printed afterwards so it still follows the R&D output
+        repair_lines = []
         for player in self.players:
             player.advance_month()
-
-        # 4.5. Generate repair returns for each player
-        print(f"\n--- Device Repairs ---")
-        any_repairs = False
-        for player in self.players:
             new_repairs = player.generate_monthly_repairs()
             if new_repairs:
-                any_repairs = True
-                print(f"\n🔧 {player.name} - Devices Returned for Repair:")
+                repair_lines.append(f"\n🔧 {player.name} - Devices Returned for Repair:")
                 for blueprint_name, count in new_repairs.items():
-                    # Find blueprint to show repair cost
-                    blueprint = None
-                    for bp in player.blueprints:
-                        if bp.name == blueprint_name:
-                            blueprint = bp
-                            break
+                    blueprint = player.get_blueprint(blueprint_name)
                     if blueprint:
                         repair_cost = blueprint.get_repair_cost()
                         return_rate = blueprint.get_repair_return_rate()
-                        print(f"  - {count}x {blueprint_name} (Return rate: {return_rate:.2f}%, Cost: ${repair_cost}/unit)")
+                        repair_lines.append(f"  - {count}x {blueprint_name} (Return rate: {return_rate:.2f}%, Cost: ${repair_cost}/unit)")
 
-        if not any_repairs:
-            print("  No devices returned for repair this month.")
+        self._print(f"\n--- Device Repairs ---")
+        if repair_lines:
+            for line in repair_lines:
+                self._print(line)
+        else:
+            self._print("  No devices returned for repair this month.")
 
         # 4.6. Calculate brand reputation changes for each player
-        print(f"\n--- Brand Reputation Update ---")
+        self._print(f"\n--- Brand Reputation Update ---")
         any_brand_changes = False
         for player in self.players:
             change = player.calculate_brand_reputation_changes(self.global_tech_level)
@@ -1830,7 +2219,7 @@ class Game:
                 any_brand_changes = True
 
         if not any_brand_changes:
-            print("  No brand reputation changes this month.")
+            self._print("  No brand reputation changes this month.")
 
         # 5. Check if it's time for tech advancement
         if self.months_until_tech_advance <= 0:
@@ -1843,35 +2232,102 @@ class Game:
         # Display countdown to next tech advancement
         years_remaining = self.months_until_tech_advance // 12
         months_remaining = self.months_until_tech_advance % 12
-        min_tier, max_tier = self.get_available_tier_range()
 
-        print(f"\n📅 Global Month: {self.global_month}")
-        print(f"🔬 Current Tech Level: T{min_tier}-T{max_tier}")
+        self._print(f"\n📅 Global Month: {self.global_month}")
+        self._print(f"🔬 Current Tech Level: T{self.min_tier}-T{self.max_tier}")
         if years_remaining > 0:
-            print(f"⏳ Next tech advancement in {years_remaining} year(s) and {months_remaining} month(s)")
+            self._print(f"⏳ Next tech advancement in {years_remaining} year(s) and {months_remaining} month(s)")
         else:
-            print(f"⏳ Next tech advancement in {months_remaining} month(s)")
+            self._print(f"⏳ Next tech advancement in {months_remaining} month(s)")
 
         # 7. Reset players ready tracking
-        self.players_ready_for_next_month.clear()
+        self.players_ready_mask = 0
+
+    def run_batch(self, months: int, policy: Optional[Callable[['Game', Player], None]] = None):
+        """
+        Advance the game the given number of months without prompting or printing.
 
-    def save_game(self, filename: str = "savegame.json"):
-        """Save game to JSON file"""
+        If given, policy(game, player) is called for every player at the start of
+        each month to make that player's moves (R&D, blueprints, manufacturing, ...).
+        """
+        reporters = [self, self.customer_market, *self.players]
+        previous = [reporter.verbose for reporter in reporters]
+        for reporter in reporters:
+            reporter.verbose = False
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.to_dict(), f, indent=2)
+            self.customer_market.initialize_market()
+            for _ in range(months):
+                if policy is not None:
+                    for player in self.players:
+                        policy(self, player)
+                self.advance_game_month()
+        finally:
+            for reporter, verbose in zip(reporters, previous):
+                reporter.verbose = verbose
+
+    def save_game(self, filename: str = "savegame.json", pretty: bool = False):
+        """
+        Save game to a JSON file, or MessagePack if the filename ends in .msgpack (.gz compresses).
+        JSON is written compactly unless pretty is set. The file is written to a
+        temporary path first and swapped in, so a failed save never corrupts the old one.
+        """
+        tmp_filename = filename + ".tmp"
+        try:
+            with open(tmp_filename, 'wb') as raw:
+                if filename.endswith('.gz'):
+                    import gzip  # Only compressed saves need it
+                    f = gzip.GzipFile(filename, 'wb', compresslevel=3, fileobj=raw)
+                else:
+                    f = raw
+                with f:
+                    if filename.removesuffix('.gz').endswith('.msgpack'):
+                        f.write(_encode_msgpack(self.to_dict()))
+                    else:
+                        self._write_json_save(f, pretty)
+            os.replace(tmp_filename, filename)
             print(f"\n✓ Game saved to {filename}")
             return True
         except Exception as e:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
             print(f"\n❌ Error saving game: {e}")
             return False
 
+    def _write_json_save(self, f, pretty: bool = False):
+        """
+        Stream the save as JSON, encoding one player and one customer group at a
+        time instead of the whole state at once. The output matches encoding
+        to_dict() in one go.
+        """
+        # Line break before top-level values, and the key separator
+        top, colon = (b'\n  ', b': ') if pretty else (b'', b':')
+
+        def player_state(player):
+            state = player.to_dict()
+            if JSON_FRAGMENTS_SUPPORTED and not pretty:
+                # Blueprints are immutable, so reuse their encoded JSON across saves
+                # (fragments are written as-is, so only the compact format can use them)
+                state['blueprints'] = [bp.to_json_fragment() for bp in player.blueprints]
+            return state
+
+        f.write(b'{' + top + b'"players"' + colon)
+        _write_json_array(f, map(player_state, self.players), pretty, 1)
+
+        for key, value in self._state_without_players().items():
+            f.write(b',' + top + _encode_json(key) + colon)
+            if value is self.customer_market:
+                value.write_json(f, pretty, 1)
+            else:
+                f.write(_encode_json_at(value, pretty, 1))
+        f.write(b'\n}' if pretty else b'}')
+
     @staticmethod
     def load_game(filename: str = "savegame.json"):
-        """Load game from JSON file"""
+        """Load game from a JSON or MessagePack save file, optionally gzip-compressed"""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            data = _decode_save_data(raw)
             game = Game.from_dict(data)
             print(f"\n✓ Game loaded from {filename}")
             return game
@@ -1884,14 +2340,8 @@ class Game:
 
     def setup_players(self):
         """Set up players for a new game"""
-        while True:
-            try:
-                num_players = int(input("\nHow many players? (1-4): "))
-                if 1 <= num_players <= 4:
-                    break
-                print("Please enter a number between 1 and 4")
-            except ValueError:
-                print("Please enter a valid number")
+        num_players = prompt_int("\nHow many players? (1-4): ", 1, 4,
+                                 "Please enter a number between 1 and 4", "Please enter a valid number")
 
         for i in range(num_players):
             name = input(f"Enter name for Player {i+1}: ").strip()
@@ -1915,45 +2365,45 @@ class Game:
 
     def menu_rnd(self, player: Player):
         """R&D menu"""
-        min_tier, max_tier = self.get_available_tier_range()
+        min_tier, max_tier = self.min_tier, self.max_tier
 
         while True:
-            print("\n" + "="*60)
-            print("R&D MENU")
-            print("="*60)
-            print(f"Current tech level: T{min_tier}-T{max_tier}")
-            player.display_unlocked_tiers()
-            player.display_ongoing_rnd()
-
-            print(f"\nCurrent balance: ${player.money:,}")
-            print("\nAvailable actions:")
-            print("1. Start new R&D project")
-            print("2. View R&D costs")
-            print("3. Back to main menu")
+            write_lines(
+                ["\n" + "="*60, "R&D MENU", "="*60, f"Current tech level: T{min_tier}-T{max_tier}"]
+                + player.get_unlocked_tiers_lines()
+                + player.get_ongoing_rnd_lines()
+                + [
+                    f"\nCurrent balance: ${player.money:,}",
+                    "\nAvailable actions:",
+                    "1. Start new R&D project",
+                    "2. View R&D costs",
+                    "3. Back to main menu",
+                ]
+            )
 
             choice = input("\nChoice: ").strip()
 
             if choice == '1':
-                print("\nSelect part type:")
-                for i, part in enumerate(ALL_PARTS, 1):
-                    current_tier = player.unlocked_tiers[part]
+                lines = ["\nSelect part type:"]
+                for i, (part, current_tier) in enumerate(zip(ALL_PARTS, player.unlocked_tiers), 1):
                     next_tier = current_tier + 1
 
                     if next_tier <= max_tier and next_tier <= MAX_TIER:
-                        cost, months = RND_CONFIG.get(next_tier, (0, 0))
-                        print(f"{i}. {part.capitalize()} (Current: T{current_tier}, "
-                              f"Next: T{next_tier}, Cost: ${cost:,}, Time: {months} months)")
+                        cost, months = RND_CONFIG[next_tier]
+                        lines.append(f"{i}. {PART_DISPLAY_NAMES[part]} (Current: T{current_tier}, "
+                                     f"Next: T{next_tier}, Cost: ${cost:,}, Time: {months} months)")
                     elif next_tier > max_tier:
-                        print(f"{i}. {part.capitalize()} (Current: T{current_tier}, "
-                              f"Next: T{next_tier} - not yet available, wait for tech advancement)")
+                        lines.append(f"{i}. {PART_DISPLAY_NAMES[part]} (Current: T{current_tier}, "
+                                     f"Next: T{next_tier} - not yet available, wait for tech advancement)")
                     else:
-                        print(f"{i}. {part.capitalize()} (Current: T{current_tier}, MAX TIER REACHED)")
+                        lines.append(f"{i}. {PART_DISPLAY_NAMES[part]} (Current: T{current_tier}, MAX TIER REACHED)")
+                write_lines(lines)
 
                 try:
                     part_choice = int(input("\nSelect part (number): ")) - 1
                     if 0 <= part_choice < len(ALL_PARTS):
                         part_type = ALL_PARTS[part_choice]
-                        current_tier = player.unlocked_tiers[part_type]
+                        current_tier = player.unlocked_tiers[part_choice]
                         target_tier = current_tier + 1
 
                         if target_tier <= MAX_TIER:
@@ -1966,9 +2416,10 @@ class Game:
                     print("❌ Invalid input")
 
             elif choice == '2':
-                print("\n--- R&D Costs & Time ---")
-                for tier, (cost, months) in sorted(RND_CONFIG.items()):
-                    print(f"  T{tier}: ${cost:,} - {months} months")
+                lines = ["\n--- R&D Costs & Time ---"]
+                for tier, (cost, months) in enumerate(RND_CONFIG[2:], start=2):
+                    lines.append(f"  T{tier}: ${cost:,} - {months} months")
+                write_lines(lines)
 
             elif choice == '3':
                 break
@@ -2018,9 +2469,15 @@ class Game:
             elif choice == '2':
                 break
 
+    # Score breakdown rows shown when creating a blueprint, heaviest weight first
+    _SCORE_BREAKDOWN_PARTS = (
+        ("SoC", 'soc'), ("Battery", 'battery'), ("Screen", 'screen'), ("RAM", 'ram'),
+        ("Camera", 'camera'), ("Storage", 'storage'), ("Casing", 'casing'),
+    )
+
     def menu_create_phone(self, player: Player):
         """Create phone blueprint menu"""
-        min_tier, max_tier = self.get_available_tier_range()
+        min_tier, max_tier = self.min_tier, self.max_tier
 
         print("\n" + "="*60)
         print("CREATE PHONE BLUEPRINT")
@@ -2042,151 +2499,89 @@ class Game:
         print("Note: High quality screen/casing reduces repair rate by 0.25% each")
         print()
 
-        for part in CORE_PARTS:
-            while True:
-                try:
-                    max_available = min(player.unlocked_tiers[part], max_tier)
-                    tier = int(input(f"  {part.capitalize()} tier (T{min_tier}-T{max_available}): "))
-                    if min_tier <= tier <= max_available:
-                        parts[part] = tier
-                        break
-                    else:
-                        print(f"    Invalid. Must be between {min_tier} and {max_available}")
-                except ValueError:
-                    print("    Invalid input")
+        for part, unlocked_tier in zip(CORE_PARTS, player.unlocked_tiers):
+            part_name = PART_DISPLAY_NAMES[part]
+            max_available = min(unlocked_tier, max_tier)
+            parts[part] = prompt_int(f"  {part_name} tier (T{min_tier}-T{max_available}): ", min_tier, max_available,
+                                     f"    Invalid. Must be between {min_tier} and {max_available}", "    Invalid input")
 
             # Ask for quality
             while True:
-                quality_choice = input(f"  {part.capitalize()} quality ([L]ow/[N]ormal/[H]igh, default N): ").strip().upper()
-                if quality_choice == '' or quality_choice == 'N':
-                    quality[part] = "Normal"
-                    break
-                elif quality_choice == 'L':
-                    quality[part] = "Low"
+                quality_choice = input(f"  {part_name} quality ([L]ow/[N]ormal/[H]igh, default N): ").strip().upper()
+                if quality_choice in QUALITY_CHOICES:
+                    quality[part] = QUALITY_CHOICES[quality_choice]
                     break
-                elif quality_choice == 'H':
-                    quality[part] = "High"
-                    break
-                else:
-                    print("    Invalid. Enter L, N, or H")
+                print("    Invalid. Enter L, N, or H")
 
         # Optional fingerprint
-        if player.unlocked_tiers['fingerprint'] > 0:
+        fingerprint_unlocked = player.tier_of('fingerprint')
+        if fingerprint_unlocked > 0:
             use_fingerprint = input("\nInclude fingerprint sensor? (y/n): ").strip().lower()
             if use_fingerprint == 'y':
-                while True:
-                    try:
-                        max_available = min(player.unlocked_tiers['fingerprint'], max_tier)
-                        tier = int(input(f"  Fingerprint tier (T{min_tier}-T{max_available}): "))
-                        if min_tier <= tier <= max_available:
-                            parts['fingerprint'] = tier
-                            break
-                        else:
-                            print(f"    Invalid. Must be between {min_tier} and {max_available}")
-                    except ValueError:
-                        print("    Invalid input")
+                max_available = min(fingerprint_unlocked, max_tier)
+                parts['fingerprint'] = prompt_int(f"  Fingerprint tier (T{min_tier}-T{max_available}): ", min_tier, max_available,
+                                                  f"    Invalid. Must be between {min_tier} and {max_available}", "    Invalid input")
 
                 # Ask for fingerprint quality
                 while True:
                     quality_choice = input(f"  Fingerprint quality ([L]ow/[N]ormal/[H]igh, default N): ").strip().upper()
-                    if quality_choice == '' or quality_choice == 'N':
-                        quality['fingerprint'] = "Normal"
-                        break
-                    elif quality_choice == 'L':
-                        quality['fingerprint'] = "Low"
+                    if quality_choice in QUALITY_CHOICES:
+                        quality['fingerprint'] = QUALITY_CHOICES[quality_choice]
                         break
-                    elif quality_choice == 'H':
-                        quality['fingerprint'] = "High"
-                        break
-                    else:
-                        print("    Invalid. Enter L, N, or H")
+                    print("    Invalid. Enter L, N, or H")
             else:
                 quality['fingerprint'] = "Normal"
         else:
             print("\nFingerprint sensor not available (need to R&D first)")
             quality['fingerprint'] = "Normal"
 
-        # Calculate phone score and tier
-        score = 0
-        score += parts['soc'] * SCORING_WEIGHTS['soc']
-        score += parts['battery'] * SCORING_WEIGHTS['battery']
-        score += parts['screen'] * SCORING_WEIGHTS['screen']
-        score += parts['ram'] * SCORING_WEIGHTS['ram']
-        score += parts['camera'] * SCORING_WEIGHTS['camera']
-        score += parts['storage'] * SCORING_WEIGHTS['storage']
-        score += parts['casing'] * SCORING_WEIGHTS['casing']
-
-        # Determine tier
-        threshold_shift = (self.global_tech_level - 1) * 20
-        entry_level_max = 20 + threshold_shift
-        budget_max = 40 + threshold_shift
-        midrange_max = 60 + threshold_shift
-        high_end_max = 80 + threshold_shift
-
-        if score <= entry_level_max:
-            tier_name = "Entry Level"
-        elif score <= budget_max:
-            tier_name = "Budget"
-        elif score <= midrange_max:
-            tier_name = "Midrange"
-        elif score <= high_end_max:
-            tier_name = "High End"
-        else:
-            tier_name = "Flagship"
-
-        print(f"\n--- Phone Quality Analysis ---")
-        print(f"Quality Score: {score}")
-        print(f"Market Tier: {tier_name}")
-        print(f"Score breakdown:")
-        print(f"  SoC: {parts['soc']} × {SCORING_WEIGHTS['soc']} = {parts['soc'] * SCORING_WEIGHTS['soc']}")
-        print(f"  Battery: {parts['battery']} × {SCORING_WEIGHTS['battery']} = {parts['battery'] * SCORING_WEIGHTS['battery']}")
-        print(f"  Screen: {parts['screen']} × {SCORING_WEIGHTS['screen']} = {parts['screen'] * SCORING_WEIGHTS['screen']}")
-        print(f"  RAM: {parts['ram']} × {SCORING_WEIGHTS['ram']} = {parts['ram'] * SCORING_WEIGHTS['ram']}")
-        print(f"  Camera: {parts['camera']} × {SCORING_WEIGHTS['camera']} = {parts['camera'] * SCORING_WEIGHTS['camera']}")
-        print(f"  Storage: {parts['storage']} × {SCORING_WEIGHTS['storage']} = {parts['storage'] * SCORING_WEIGHTS['storage']}")
-        print(f"  Casing: {parts['casing']} × {SCORING_WEIGHTS['casing']} = {parts['casing'] * SCORING_WEIGHTS['casing']}")
-
-        # Calculate suggested price
-        suggested_cost = 0
-        for part in CORE_PARTS:
-            suggested_cost += PART_COSTS[part][parts[part]]
-        if 'fingerprint' in parts:
-            suggested_cost += PART_COSTS['fingerprint'][parts['fingerprint']]
+        # Score and base part cost come from a preview of the blueprint, computed once
+        # at construction (normal quality, so the suggested price ignores quality)
+        preview = PhoneBlueprint(
+            name=name, sell_price=0, fingerprint_tier=parts.get('fingerprint', 0),
+            **{f"{part}_tier": parts[part] for part in CORE_PARTS}
+        )
+        score = preview.calculate_score()
+        tier_name = preview.get_tier_name(self.global_tech_level)
+        suggested_cost = preview.get_production_cost()
+
+        lines = [
+            f"\n--- Phone Quality Analysis ---",
+            f"Quality Score: {score}",
+            f"Market Tier: {tier_name}",
+            f"Score breakdown:",
+        ]
+        for label, part in self._SCORE_BREAKDOWN_PARTS:
+            weight = SCORING_WEIGHTS[part]
+            lines.append(f"  {label}: {parts[part]} × {weight} = {parts[part] * weight}")
+        write_lines(lines)
 
         print(f"\n--- Cost Analysis ---")
         print(f"Production cost per unit: ${suggested_cost}")
         print(f"Suggested sell price (1.5x cost): ${int(suggested_cost * 1.5)}")
 
-        while True:
-            try:
-                sell_price = int(input("Enter sell price: $"))
-                if sell_price > 0:
-                    break
-                else:
-                    print("Price must be positive")
-            except ValueError:
-                print("Invalid input")
+        sell_price = prompt_int("Enter sell price: $", 1, None, "Price must be positive")
 
         player.create_blueprint(name, parts, sell_price, quality, min_tier, max_tier, self.global_tech_level)
 
     def menu_manufacturing(self, player: Player):
         """Manufacturing menu"""
         while True:
-            print("\n" + "="*60)
-            print("MANUFACTURING")
-            print("="*60)
-            player.display_blueprints(self.global_tech_level)
-            player.display_manufacturing_queue()
-            player.display_manufactured_phones()
+            lines = (
+                ["\n" + "="*60, "MANUFACTURING", "="*60]
+                + player.get_blueprints_lines(self.global_tech_level)
+                + player.get_manufacturing_queue_lines()
+                + player.get_manufactured_phones_lines()
+            )
 
             if not player.blueprints:
-                print("\n❌ No blueprints available. Create a blueprint first!")
+                lines.append("\n❌ No blueprints available. Create a blueprint first!")
+                write_lines(lines)
                 input("\nPress Enter to continue...")
                 break
 
-            print("\nActions:")
-            print("1. Start manufacturing phones")
-            print("2. Back to main menu")
+            lines += ["\nActions:", "1. Start manufacturing phones", "2. Back to main menu"]
+            write_lines(lines)
 
             choice = input("\nChoice: ").strip()
 
@@ -2197,10 +2592,12 @@ class Game:
                     input("\nPress Enter to continue...")
                     continue
 
-                print("\nSelect blueprint:")
+                lines = ["\nSelect blueprint:"]
                 for i, bp in enumerate(player.blueprints, 1):
                     tier_name = bp.get_tier_name(self.global_tech_level)
-                    print(f"{i}. {bp.name} [{tier_name}] (Cost: ${bp.get_production_cost()}/unit, Profit: ${bp.sell_price - bp.get_production_cost()}/unit)")
+                    cost = bp.get_production_cost()
+                    lines.append(f"{i}. {bp.name} [{tier_name}] (Cost: ${cost}/unit, Profit: ${bp.sell_price - cost}/unit)")
+                write_lines(lines)
 
                 try:
                     bp_choice = int(input("\nBlueprint number: ")) - 1
@@ -2249,11 +2646,7 @@ class Game:
                 for i, blueprint_name in enumerate(blueprint_list, 1):
                     quantity = player.pending_repairs[blueprint_name]
                     # Find blueprint to show repair cost
-                    blueprint = None
-                    for bp in player.blueprints:
-                        if bp.name == blueprint_name:
-                            blueprint = bp
-                            break
+                    blueprint = player.get_blueprint(blueprint_name)
                     if blueprint:
                         repair_cost = blueprint.get_repair_cost()
                         print(f"{i}. {blueprint_name}: {quantity} units @ ${repair_cost}/unit")
@@ -2323,122 +2716,131 @@ class Game:
         player = self.get_current_player()
 
         while True:
-            player.display_status()
-
-            # Display global tech info
-            min_tier, max_tier = self.get_available_tier_range()
-            years_remaining = self.months_until_tech_advance // 12
-            months_remaining = self.months_until_tech_advance % 12
-
-            print(f"\n📅 Global Month: {self.global_month}")
-            print(f"🔬 Tech Level: T{min_tier}-T{max_tier}")
-            if years_remaining > 0:
-                print(f"⏳ Next tech advancement: {years_remaining}y {months_remaining}m")
-            else:
-                print(f"⏳ Next tech advancement: {months_remaining}m")
-
-            print("\n--- MAIN MENU ---")
-            print("1. Advance Month")
-            print(f"2. Create Phone Blueprint ({len(player.blueprints)}/{MAX_BLUEPRINTS})")
-            print("3. Manage Blueprints")
-            print("4. Manufacturing")
             # Show notification if there are pending repairs
             if player.pending_repairs:
                 total_pending = sum(player.pending_repairs.values())
-                print(f"5. Device Repairs (⚠️  {total_pending} devices awaiting repair)")
+                repairs_option = f"5. Device Repairs (⚠️  {total_pending} devices awaiting repair)"
             else:
-                print("5. Device Repairs")
-            print("6. R&D")
-            print("7. View Status")
-            print("8. View Customer Market")
-            print("9. Save Game")
-            print("10. Next Player" if len(self.players) > 1 else "10. (Single Player)")
-            print("11. Quit")
+                repairs_option = "5. Device Repairs"
+
+            write_lines(player.get_status_lines() + self.get_tech_banner_lines() + [
+                "\n--- MAIN MENU ---",
+                "1. Advance Month",
+                f"2. Create Phone Blueprint ({len(player.blueprints)}/{MAX_BLUEPRINTS})",
+                "3. Manage Blueprints",
+                "4. Manufacturing",
+                repairs_option,
+                self._MAIN_MENU_TAIL[len(self.players) > 1],
+            ])
 
             choice = input("\nChoice: ").strip()
 
-            if choice == '1':
-                # Mark current player as ready for next month
-                self.players_ready_for_next_month.add(player.name)
-                print(f"\n✓ {player.name} is ready to advance to next month")
-
-                # Check if all players are ready
-                if len(self.players_ready_for_next_month) == len(self.players):
-                    # All players ready - actually advance the month
-                    self.advance_game_month()
-                    input("\nPress Enter to continue...")
-                else:
-                    # Not all players ready - switch to next player
-                    waiting_players = [p.name for p in self.players if p.name not in self.players_ready_for_next_month]
-                    print(f"\nWaiting for: {', '.join(waiting_players)}")
-                    print("\nSwitching to next player...")
-                    self.next_player()
-                    print(f"\n>>> Now playing as {self.get_current_player().name} <<<")
-                    input("Press Enter to continue...")
+            handler = self._MAIN_MENU_ACTIONS.get(choice)
+            if handler is not None:
+                result = handler(self, player)
+                if result == 'quit':
+                    return 'quit'
+                if result == 'switch':
                     return  # Return to show next player's menu
 
-            elif choice == '2':
-                self.menu_create_phone(player)
-
-            elif choice == '3':
-                self.menu_manage_blueprints(player)
+    # Main menu actions. Each takes the current player and returns None to stay
+    # in the menu, 'switch' to hand over to the next player, or 'quit'.
 
-            elif choice == '4':
-                self.menu_manufacturing(player)
-
-            elif choice == '5':
-                self.menu_repairs(player)
-
-            elif choice == '6':
-                self.menu_rnd(player)
-
-            elif choice == '7':
-                player.display_status()
-                player.display_unlocked_tiers()
-                player.display_ongoing_rnd()
-                player.display_blueprints(self.global_tech_level)
-                player.display_manufacturing_queue()
-                player.display_manufactured_phones()
-                player.display_pending_repairs()
-                input("\nPress Enter to continue...")
+    def _menu_advance_month(self, player: Player):
+        # Mark current player as ready for next month
+        self.players_ready_mask |= 1 << self.current_player_index
+        print(f"\n✓ {player.name} is ready to advance to next month")
 
-            elif choice == '8':
-                if self.customer_market.customer_groups:
-                    self.customer_market.display_customer_breakdown()
-                else:
-                    print("\n❌ No customer data yet. Market needs to be initialized.")
-                input("\nPress Enter to continue...")
-
-            elif choice == '9':
-                filename = input("Enter filename (default: savegame.json): ").strip()
-                if not filename:
-                    filename = "savegame.json"
-                self.save_game(filename)
-                input("\nPress Enter to continue...")
-
-            elif choice == '10':
-                if len(self.players) > 1:
-                    self.next_player()
-                    print(f"\n>>> Switching to {self.get_current_player().name} <<<")
-                    input("Press Enter to continue...")
-                    return  # Return to show next player's menu
-                else:
-                    print("Single player mode - no other players")
-                    input("\nPress Enter to continue...")
-
-            elif choice == '11':
-                confirm = input("\nQuit game? (y/n): ").strip().lower()
-                if confirm == 'y':
-                    return 'quit'
+        # Check if all players are ready
+        missing_mask = ((1 << len(self.players)) - 1) & ~self.players_ready_mask
+        if not missing_mask:
+            # All players ready - actually advance the month
+            self.advance_game_month()
+            input("\nPress Enter to continue...")
+        else:
+            # Not all players ready - switch to next player
+            waiting_players = []
+            while missing_mask:
+                waiting_players.append(self.players[(missing_mask & -missing_mask).bit_length() - 1].name)
+                missing_mask &= missing_mask - 1
+            self.next_player()
+            write_lines([
+                f"\nWaiting for: {', '.join(waiting_players)}",
+                "\nSwitching to next player...",
+                f"\n>>> Now playing as {self.get_current_player().name} <<<",
+            ])
+            input("Press Enter to continue...")
+            return 'switch'
+
+    def _menu_view_status(self, player: Player):
+        player.display_full_status(self.global_tech_level)
+        input("\nPress Enter to continue...")
+
+    def _menu_view_market(self, player: Player):
+        if self.customer_market.customer_groups:
+            self.customer_market.display_customer_breakdown()
+        else:
+            print("\n❌ No customer data yet. Market needs to be initialized.")
+        input("\nPress Enter to continue...")
+
+    def _menu_save_game(self, player: Player):
+        filename = input("Enter filename (default: savegame.json): ").strip()
+        if not filename:
+            filename = "savegame.json"
+        self.save_game(filename)
+        input("\nPress Enter to continue...")
+
+    def _menu_next_player(self, player: Player):
+        if len(self.players) > 1:
+            self.next_player()
+            print(f"\n>>> Switching to {self.get_current_player().name} <<<")
+            input("Press Enter to continue...")
+            return 'switch'
+        else:
+            print("Single player mode - no other players")
+            input("\nPress Enter to continue...")
+
+    def _menu_quit(self, player: Player):
+        confirm = input("\nQuit game? (y/n): ").strip().lower()
+        if confirm == 'y':
+            return 'quit'
+
+    # Static end of the main menu, keyed by whether there is more than one player
+    _MAIN_MENU_TAIL = {
+        multiplayer: "\n".join([
+            "6. R&D",
+            "7. View Status",
+            "8. View Customer Market",
+            "9. Save Game",
+            "10. Next Player" if multiplayer else "10. (Single Player)",
+            "11. Quit",
+        ])
+        for multiplayer in (False, True)
+    }
+
+    _MAIN_MENU_ACTIONS = {
+        '1': _menu_advance_month,
+        '2': menu_create_phone,
+        '3': menu_manage_blueprints,
+        '4': menu_manufacturing,
+        '5': menu_repairs,
+        '6': menu_rnd,
+        '7': _menu_view_status,
+        '8': _menu_view_market,
+        '9': _menu_save_game,
+        '10': _menu_next_player,
+        '11': _menu_quit,
+    }
 
     def run(self):
         """Main game loop"""
-        print("\n" + "="*60)
-        print("COMPETITIVE PHONE MANUFACTURING SIMULATOR")
-        print("="*60)
-
-        print("\n1. New Game")
-        print("2. Load Game")
+        write_lines([
+            "\n" + "="*60,
+            "COMPETITIVE PHONE MANUFACTURING SIMULATOR",
+            "="*60,
+            "\n1. New Game",
+            "2. Load Game",
+        ])
 
         choice = input("\nChoice: ").strip()
 
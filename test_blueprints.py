@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for blueprint storage and lookup
+"""
+from manufacturing_sim import Player, PhoneBlueprint
+
+BASIC_PARTS = {
+    'ram': 2, 'soc': 2, 'screen': 2, 'battery': 2,
+    'camera': 2, 'casing': 2, 'storage': 2
+}
+
+def test_blueprint_lookup():
+    """Test that blueprints can be found by name after create/delete"""
+    player = Player("Test Player")
+    assert player.create_blueprint("Alpha", dict(BASIC_PARTS), sell_price=300)
+    assert player.create_blueprint("Beta", dict(BASIC_PARTS), sell_price=400)
+
+    assert player.get_blueprint("Alpha").sell_price == 300
+    assert player.get_blueprint("Beta").sell_price == 400
+    assert player.get_blueprint("Gamma") is None
+
+    # Duplicate names are rejected
+    assert not player.create_blueprint("Alpha", dict(BASIC_PARTS), sell_price=500)
+
+    assert player.delete_blueprint("Alpha")
+    assert player.get_blueprint("Alpha") is None
+    assert [bp.name for bp in player.blueprints] == ["Beta"]
+    print("✓ Blueprint lookup test passed")
+
+def test_blueprint_lookup_after_direct_append():
+    """Test that blueprints appended to the list directly are still found"""
+    player = Player("Test Player")
+    blueprint = PhoneBlueprint(
+        name="Direct", ram_tier=1, soc_tier=1, screen_tier=1,
+        battery_tier=1, camera_tier=1, casing_tier=1, storage_tier=1,
+        fingerprint_tier=0, sell_price=100
+    )
+    player.blueprints.append(blueprint)
+
+    assert player.get_blueprint("Direct") is blueprint
+    assert player.manufacture_phone("Direct", 10)
+    print("✓ Direct append lookup test passed")
+
+def test_blueprint_lookup_after_direct_replace_and_remove():
+    """Test that the lookup follows direct list edits that keep its length"""
+    def make(name):
+        return PhoneBlueprint(
+            name=name, ram_tier=1, soc_tier=1, screen_tier=1,
+            battery_tier=1, camera_tier=1, casing_tier=1, storage_tier=1,
+            fingerprint_tier=0, sell_price=100
+        )
+
+    player = Player("Test Player")
+    player.create_blueprint("Alpha", dict(BASIC_PARTS), sell_price=300)
+
+    # Replace in place
+    player.blueprints[0] = make("Beta")
+    assert player.get_blueprint("Alpha") is None
+    assert player.get_blueprint("Beta") is player.blueprints[0]
+    assert player.manufacture_phone("Beta", 1)
+
+    # Remove, then append a different one
+    player.blueprints.remove(player.blueprints[0])
+    player.blueprints.append(make("Gamma"))
+    assert player.get_blueprint("Beta") is None
+    assert player.get_blueprint("Gamma") is player.blueprints[0]
+
+    # Assign a plain list
+    player.blueprints = [make("Delta")]
+    assert player.get_blueprint("Gamma") is None
+    assert player.get_blueprint("Delta") is player.blueprints[0]
+    print("✓ Direct replace/remove lookup test passed")
+
+def test_blueprints_are_frozen():
+    """Test that a blueprint cannot be changed after creation (its cached values stay valid)"""
+    from dataclasses import FrozenInstanceError
+
+    player = Player("Test Player")
+    player.create_blueprint("Alpha", dict(BASIC_PARTS), sell_price=300)
+    blueprint = player.get_blueprint("Alpha")
+    cost = blueprint.get_production_cost()
+
+    try:
+        blueprint.ram_tier = 5
+    except FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("Expected blueprint to be frozen")
+    assert blueprint.ram_tier == 2 and blueprint.get_production_cost() == cost
+    print("✓ Frozen blueprint test passed")
+
+def test_to_dict_returns_a_copy():
+    """Test that editing a serialized blueprint does not leak into later saves"""
+    player = Player("Test Player")
+    player.create_blueprint("Alpha", dict(BASIC_PARTS), sell_price=300)
+    blueprint = player.get_blueprint("Alpha")
+
+    data = blueprint.to_dict()
+    data['sell_price'] = 1
+    assert blueprint.to_dict()['sell_price'] == 300
+    assert player.to_dict()['blueprints'][0]['sell_price'] == 300
+    print("✓ Blueprint to_dict copy test passed")
+
+def test_unrecognised_quality_costs_as_normal():
+    """Test that quality values other than Low/Normal/High (e.g. from edited saves) cost as Normal"""
+    player = Player("Test Player")
+    player.create_blueprint("Alpha", dict(BASIC_PARTS), sell_price=300)
+    data = player.get_blueprint("Alpha").to_dict()
+    data['ram_quality'] = "normal"
+    data['camera_quality'] = "Ultra"
+
+    blueprint = PhoneBlueprint.from_dict(data)
+    assert blueprint.get_production_cost() == player.get_blueprint("Alpha").get_production_cost()
+    print("✓ Unrecognised quality cost test passed")
+
+def test_blueprint_lookup_after_load():
+    """Test that the name index is rebuilt when loading a player"""
+    player = Player("Test Player")
+    player.create_blueprint("Alpha", dict(BASIC_PARTS), sell_price=300)
+
+    loaded_player = Player.from_dict(player.to_dict())
+    assert loaded_player.get_blueprint("Alpha") == player.get_blueprint("Alpha")
+    print("✓ Lookup after load test passed")
+
+if __name__ == "__main__":
+    print("Running blueprint tests...\n")
+
+    test_blueprint_lookup()
+    test_blueprint_lookup_after_direct_append()
+    test_blueprint_lookup_after_direct_replace_and_remove()
+    test_blueprints_are_frozen()
+    test_to_dict_returns_a_copy()
+    test_unrecognised_quality_costs_as_normal()
+    test_blueprint_lookup_after_load()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script for headless (non-interactive) game advancement
+"""
+import contextlib
+import io
+
+import manufacturing_sim
+from manufacturing_sim import JSON_FRAGMENTS_SUPPORTED, Game, Player, _encode_json
+
+BASIC_PARTS = {
+    'ram': 1, 'soc': 1, 'screen': 1, 'battery': 1,
+    'camera': 1, 'casing': 1, 'storage': 1
+}
+
+def make_player():
+    """Create a player with R&D and manufacturing in progress"""
+    player = Player("Test Player")
+    player.money = 10_000_000
+    player.create_blueprint("Budget", dict(BASIC_PARTS), sell_price=100)
+    player.start_rnd('soc', 6)
+    player.start_rnd('ram', 6)
+    player.manufacture_phone("Budget", 100)
+    return player
+
+def test_advance_months_matches_repeated_advance():
+    """Test that advance_months(n) ends in the same state as n advance_month calls"""
+    for months in (1, 3, 7):
+        stepped = make_player()
+        for _ in range(months):
+            stepped.advance_month()
+        stepped.complete_manufacturing()
+
+        batched = make_player()
+        batched.advance_months(months)
+        batched.complete_manufacturing()
+
+        assert batched.to_dict() == stepped.to_dict(), f"State differs after {months} months"
+    print("✓ Batch advance test passed")
+
+def test_run_batch_is_silent():
+    """Test that run_batch plays out months without printing anything"""
+    game = Game()
+    game.players = [Player("Alpha Corp"), Player("Beta Inc")]
+
+    def policy(game, player):
+        if not player.blueprints:
+            player.create_blueprint("Budget", dict(BASIC_PARTS), sell_price=100)
+        player.manufacture_phone("Budget", 200)
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        game.run_batch(6, policy)
+
+    assert output.getvalue() == "", f"Unexpected output: {output.getvalue()[:200]}"
+    assert game.global_month == 7
+    assert all(sum(p.sold_devices.values()) > 0 for p in game.players), "Expected phones to be sold"
+    assert game.verbose and all(p.verbose for p in game.players), "verbose should be restored"
+    print("✓ Silent batch run test passed")
+
+def test_ready_players_load_from_older_saves():
+    """Test that the ready-player bitmask survives saving and converts older name lists"""
+    game = Game()
+    game.players = [Player("Alpha Corp"), Player("Beta Inc"), Player("Gamma Ltd")]
+    game.players_ready_mask = 0b101
+
+    assert Game.from_dict(game.to_dict()).players_ready_mask == 0b101
+
+    # Older saves listed the names of the ready players
+    data = game.to_dict()
+    del data['players_ready_mask']
+    data['players_ready_for_next_month'] = ["Gamma Ltd", "Alpha Corp"]
+    assert Game.from_dict(data).players_ready_mask == 0b101
+    print("✓ Ready players load test passed")
+
+def test_month_report_written_at_once():
+    """Test that the end of month report reaches stdout in a single write"""
+    game = Game()
+    game.players = [make_player(), Player("Beta Inc")]
+    game.customer_market.verbose = False
+    game.customer_market.initialize_market()
+    game.customer_market.verbose = True
+
+    writes = []
+
+    class RecordingStream(io.StringIO):
+        def write(self, text):
+            writes.append(text)
+            return super().write(text)
+
+    output = RecordingStream()
+    with contextlib.redirect_stdout(output):
+        game.advance_game_month()
+
+    assert len(writes) == 1, f"Expected one write, got {len(writes)}"
+    report = output.getvalue()
+    assert report.index("END OF MONTH 1 REPORT") < report.index("--- Manufacturing Completion ---") \
+        < report.index("--- Device Repairs ---") < report.index("--- Brand Reputation Update ---")
+    print("✓ Buffered month report test passed")
+
+def test_streamed_save_matches_to_dict():
+    """Test that the streamed JSON save encodes the same as to_dict(), compact and pretty"""
+    game = Game()
+    game.players = [make_player(), Player("Beta Inc")]
+    game.players[0].create_blueprint("Flagship", dict(BASIC_PARTS), sell_price=900)
+    game.customer_market.verbose = False
+    game.customer_market.initialize_market()
+    game.customer_market.sales_history = {1: {"Test Player": 300}}
+    if JSON_FRAGMENTS_SUPPORTED:
+        game.players[0].get_blueprint("Budget").to_json_fragment()  # Encoded before the save
+
+    for pretty in (False, True):
+        output = io.BytesIO()
+        game._write_json_save(output, pretty)
+        assert output.getvalue() == _encode_json(game.to_dict(), pretty), f"Save differs (pretty={pretty})"
+
+    if JSON_FRAGMENTS_SUPPORTED:
+        # Compact saves splice in (and keep) each blueprint's encoded JSON
+        assert all(bp._json_cache is not None for p in game.players for bp in p.blueprints)
+    print("✓ Streamed save test passed")
+
+def test_json_fallback_matches_orjson():
+    """Test that the stdlib json fallback encodes saves exactly like orjson (non-ASCII names too)"""
+    if manufacturing_sim.orjson is None:
+        print("- Skipped JSON fallback test (orjson is not installed)")
+        return
+
+    game = Game()
+    game.players = [make_player(), Player("Müller & Søn 株式会社")]
+    game.players[1].create_blueprint("Téléphone", dict(BASIC_PARTS), sell_price=150)
+    game.customer_market.sales_history = {1: {"Müller & Søn 株式会社": 10}}
+    data = game.to_dict()
+
+    for pretty in (False, True):
+        with_orjson = _encode_json(data, pretty)
+        orjson_module, manufacturing_sim.orjson = manufacturing_sim.orjson, None
+        try:
+            with_json = _encode_json(data, pretty)
+        finally:
+            manufacturing_sim.orjson = orjson_module
+        assert with_json == with_orjson, f"Encoders differ (pretty={pretty})"
+    print("✓ JSON fallback encoding test passed")
+
+if __name__ == "__main__":
+    print("Running headless tests...\n")
+
+    test_advance_months_matches_repeated_advance()
+    test_run_batch_is_silent()
+    test_ready_players_load_from_older_saves()
+    test_month_report_written_at_once()
+    test_streamed_save_matches_to_dict()
+    test_json_fallback_matches_orjson()
+
+    print("\n✅ All tests passed!")
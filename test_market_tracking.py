@@ -143,10 +143,67 @@ def test_simple_purchase_flow():
 
     print("\n✓ Purchase and ownership tracking test passed!")
 
+def test_sales_history_round_trip():
+    """Test that sales history keeps integer month keys through a JSON save"""
+    import json
+
+    market = CustomerMarket()
+    market.sales_history = {1: {"Alice": 300}, 2: {"Alice": 150}}
+
+    loaded = CustomerMarket.from_dict(json.loads(json.dumps(market.to_dict())))
+    assert loaded.sales_history == market.sales_history, f"Got {loaded.sales_history}"
+
+    print("\n✓ Sales history round trip test passed!")
+
+def test_customer_groups_round_trip():
+    """Test that customer groups save as rows and still load from older dict saves"""
+    import json
+
+    market = CustomerMarket()
+    market.verbose = False
+    market.initialize_market()
+    market.customer_groups[0].owned_phone_company = "Alice"
+    market.customer_groups[0].owned_phone_blueprint = "Budget Phone"
+    market.customer_groups[0].purchase_month = 3
+
+    data = json.loads(json.dumps(market.to_dict()))
+    assert all(isinstance(row, list) for row in data['customer_groups'])
+    assert CustomerMarket.from_dict(data).customer_groups == market.customer_groups
+
+    # Older saves stored one dict per group
+    data['customer_groups'] = [g.to_dict() for g in market.customer_groups]
+    assert CustomerMarket.from_dict(data).customer_groups == market.customer_groups
+
+    print("\n✓ Customer groups round trip test passed!")
+
+def test_phone_scores_for_each_customer_type():
+    """Test the per-type scores cached on a blueprint against the customer preferences"""
+    from manufacturing_sim import CUSTOMER_TYPES, CustomerGroup
+
+    phone = PhoneBlueprint(
+        name="Mixed Phone",
+        ram_tier=1, soc_tier=2, screen_tier=3, battery_tier=4,
+        camera_tier=5, casing_tier=1, storage_tier=2,
+        fingerprint_tier=3, sell_price=1000
+    )
+    tiers = {'ram': 1, 'soc': 2, 'screen': 3, 'battery': 4, 'camera': 5, 'casing': 1, 'storage': 2}
+
+    for customer_type, preferences in CUSTOMER_TYPES.items():
+        expected = sum(weight * tiers[part] for part, weight in preferences.items())
+        if customer_type == "Value Hunter":
+            expected -= 1000 / 5000 * 20
+        group = CustomerGroup("Budget", customer_type, 1)
+        assert group.evaluate_phone(phone) == expected, f"{customer_type}: {group.evaluate_phone(phone)} != {expected}"
+
+    print("\n✓ Customer type scoring test passed!")
+
 if __name__ == "__main__":
     test_market_initialization()
     test_lifecycle_calculation()
     test_simple_purchase_flow()
+    test_sales_history_round_trip()
+    test_customer_groups_round_trip()
+    test_phone_scores_for_each_customer_type()
 
     print("\n" + "="*60)
     print("ALL TESTS PASSED!")